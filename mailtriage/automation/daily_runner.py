@@ -1,26 +1,30 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import json
 import os
+import pickle
+import re
 import shlex
+import shutil
 import socket
 import subprocess
 import sys
+import threading
 import webbrowser
 from datetime import date, datetime, time, timedelta
 from pathlib import Path
-from typing import Any
-from urllib.request import urlopen
-from zoneinfo import ZoneInfo
+from typing import Any, Mapping
 
-import yaml
-
-from mailtriage.cli import main as mailtriage_main
-from mailtriage.core.config import load_config
 from mailtriage.core.notify import notify, open_file_in_browser, show_command_page
-from mailtriage.ingest.ingest import SecretProviderError
 
 
+_ONE_DAY = timedelta(days=1)
+_TWO_DAYS = timedelta(days=2)
+
+
+@functools.lru_cache(maxsize=4)
 def _parse_hhmm(value: str) -> tuple[int, int]:
     parts = value.split(":")
     if len(parts) != 2:
@@ -38,91 +42,187 @@ def _window_label_for_now(now_local: datetime, workday_start: str) -> date:
     today_start = datetime.combine(today, time(hh, mm), tzinfo=now_local.tzinfo)
 
     if now_local >= today_start:
-        return today - timedelta(days=1)
-    return today - timedelta(days=2)
+        return today - _ONE_DAY
+    return today - _TWO_DAYS
 
 
 def _read_policy(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
-    raw = yaml.safe_load(path.read_text(encoding="utf-8"))
-    return raw if isinstance(raw, dict) else {}
 
+    # Parsed policy is cached as JSON next to the YAML, keyed by the YAML's stat;
+    # json.loads is much cheaper than a YAML parse on every scheduled tick.
+    st = path.stat()
+    stamp = [st.st_mtime_ns, st.st_size]
+    cache = path.with_suffix(".cache.json")
+    try:
+        cached = json.loads(cache.read_bytes())
+        if cached.get("stat") == stamp and isinstance(cached.get("policy"), dict):
+            return cached["policy"]
+    except (OSError, ValueError, AttributeError):
+        pass
 
-def _parse_ymd(value: str) -> date:
-    return datetime.strptime(value, "%Y-%m-%d").date()
+    import yaml
 
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    raw = yaml.load(path.read_text(encoding="utf-8"), Loader=loader)
+    policy = raw if isinstance(raw, dict) else {}
 
-def _parse_compact_date(value: str) -> date | None:
-    digits = "".join(ch for ch in value if ch.isdigit())
-    if len(digits) < 8:
-        return None
     try:
-        return datetime.strptime(digits[:8], "%Y%m%d").date()
-    except ValueError:
-        return None
+        cache.write_text(json.dumps({"stat": stamp, "policy": policy}), encoding="utf-8")
+    except (OSError, TypeError, ValueError):
+        # Unwritable directory or YAML values without a JSON form (e.g. dates).
+        pass
+    return policy
+
+
+_YMD_LINE_RE = re.compile(rb"^[ \t]*(\d{4})-(\d{2})-(\d{2})[ \t]*\r?$", re.MULTILINE)
+
+
+# Any non-blank, non-comment line that is not exactly YYYY-MM-DD.
+_BAD_YMD_LINE_RE = re.compile(
+    rb"^(?![ \t]*(?:#|\r?$|\d{4}-\d{2}-\d{2}[ \t]*\r?$)).+$", re.MULTILINE
+)
 
 
 def _parse_manual_dates(path: Path) -> set[date]:
     if not path.exists():
         return set()
+    data = path.read_bytes()
+    # A malformed line must fail loudly: silently dropping a date would send
+    # notifications on a day the user marked off (or suppress a workday).
+    bad = _BAD_YMD_LINE_RE.search(data)
+    if bad is not None:
+        lineno = data.count(b"\n", 0, bad.start()) + 1
+        got = bad.group(0).decode("utf-8", errors="replace").strip()
+        raise ValueError(f"{path}:{lineno}: expected YYYY-MM-DD, got: {got}")
+    # Comment and blank lines fail the anchored pattern, so one findall covers the file.
+    try:
+        return {
+            date(int(y), int(m), int(d))
+            for y, m, d in _YMD_LINE_RE.findall(data)
+        }
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}") from e
 
-    out: set[date] = set()
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        out.add(_parse_ymd(line))
-    return out
 
+_VEVENT_RE = re.compile(rb"^BEGIN:VEVENT(.*?)^END:VEVENT", re.DOTALL | re.MULTILINE)
+_DTSTART_RE = re.compile(rb"^[ \t]*DTSTART[^\r\n:]*:[^\d\r\n]*(\d{8})", re.MULTILINE)
+_DTEND_RE = re.compile(rb"^[ \t]*DTEND[^\r\n:]*:[^\d\r\n]*(\d{8})", re.MULTILINE)
 
-def _parse_ics_dates(path: Path) -> set[date]:
-    if not path.exists():
-        return set()
 
-    out: set[date] = set()
-    start_val: date | None = None
-    end_val: date | None = None
+def _ics_date(m: re.Match[bytes] | None) -> date | None:
+    if m is None:
+        return None
+    v = m.group(1)
+    try:
+        return date(int(v[0:4]), int(v[4:6]), int(v[6:8]))
+    except ValueError:
+        return None
 
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
 
-        if line == "BEGIN:VEVENT":
-            start_val = None
-            end_val = None
+def _ics_dates_from_bytes(data: bytes, years: set[int] | None = None) -> set[date]:
+    out: set[date] = set()
+    # One regex sweep over the whole buffer instead of per-line dispatch in Python.
+    for ev in _VEVENT_RE.finditer(data):
+        block = ev.group(1)
+        start_val = _ics_date(_DTSTART_RE.search(block))
+        if start_val is None:
             continue
 
-        if line.startswith("DTSTART"):
-            _, _, value = line.partition(":")
-            start_val = _parse_compact_date(value)
+        end_val = _ics_date(_DTEND_RE.search(block))
+        # Only the runner's year window matters; long-lived calendars can carry
+        # a decade of history that would otherwise be expanded on every run.
+        if years is not None and start_val.year not in years and (
+            end_val is None or end_val.year not in years
+        ):
             continue
-
-        if line.startswith("DTEND"):
-            _, _, value = line.partition(":")
-            end_val = _parse_compact_date(value)
+        if end_val is None:
+            out.add(start_val)
             continue
 
-        if line == "END:VEVENT" and start_val is not None:
-            if end_val is None:
-                out.add(start_val)
-                continue
-
-            d = start_val
-            while d < end_val:
-                out.add(d)
-                d += timedelta(days=1)
+        out.update(map(date.fromordinal, range(start_val.toordinal(), end_val.toordinal())))
 
     return out
 
 
-def _country_holidays(country: str, subdiv: str | None, years: list[int]) -> set[date]:
+def _parse_ics_files(
+    paths: list[Path],
+    years: set[int] | None = None,
+    cache_file: Path | None = None,
+) -> set[date]:
+    existing = [p for p in paths if p.exists()]
+    if not existing:
+        return set()
+
+    # Calendars change rarely; reuse the previous result while every file's mtime
+    # (and the year window) is unchanged.
+    key = "|".join(str(p.resolve()) for p in existing)
+    stamp = (tuple(p.stat().st_mtime_ns for p in existing), tuple(sorted(years or ())))
+    cache: dict[str, tuple[Any, set[date]]] = {}
+    if cache_file is not None:
+        try:
+            with cache_file.open("rb") as f:
+                cache = pickle.load(f)
+            hit = cache.get(key)
+            if hit is not None and hit[0] == stamp:
+                return set(hit[1])
+        except Exception:
+            cache = {}
+
+    # Per file: a truncated VEVENT must not pair with the next file's END:VEVENT.
+    out: set[date] = set()
+    for p in existing:
+        out |= _ics_dates_from_bytes(p.read_bytes(), years)
+
+    if cache_file is not None:
+        cache[key] = (stamp, out)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with cache_file.open("wb") as f:
+                pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+    return set(out)
+
+
+def _country_holidays(
+    country: str,
+    subdiv: str | None,
+    years: list[int],
+    cache_dir: Path | None = None,
+) -> set[date]:
     try:
         import holidays as holidays_pkg
     except ImportError:
         return set()
 
+    # Evaluating the holiday rules is the slow part; the result only changes with the
+    # inputs or the installed package version, so keep it pickled under local state.
+    version = str(getattr(holidays_pkg, "__version__", ""))
+    cache_file: Path | None = None
+    if cache_dir is not None:
+        key = f"{country}_{subdiv or ''}_{min(years)}_{max(years)}"
+        cache_file = cache_dir / f"hol-{key}.pkl"
+        try:
+            with cache_file.open("rb") as f:
+                cached_version, cached = pickle.load(f)
+            if cached_version == version and isinstance(cached, set):
+                return cached
+        except Exception:
+            pass
+
     items = holidays_pkg.country_holidays(country, subdiv=subdiv, years=years)
-    return set(items.keys())
+    out = set(items.keys())
+
+    if cache_file is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with cache_file.open("wb") as f:
+                pickle.dump((version, out), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+    return out
 
 
 def _open_path(path: Path) -> None:
@@ -141,15 +241,6 @@ def _open_app(app_name: str) -> None:
         subprocess.run(["open", "-a", app_name], check=False)
 
 
-def _resolve_under_root(p: str | None, root: Path) -> Path | None:
-    if not p:
-        return None
-    path = Path(str(p))
-    if path.is_absolute():
-        return path
-    return root / path
-
-
 def _load_bitwarden_session(policy: dict[str, Any], rootdir: Path) -> Path | None:
     """
     If configured and present, load a Bitwarden CLI session token into BW_SESSION.
@@ -158,7 +249,7 @@ def _load_bitwarden_session(policy: dict[str, Any], rootdir: Path) -> Path | Non
     bw_cfg = policy.get("bitwarden") if isinstance(policy.get("bitwarden"), dict) else {}
     # If the user didn't configure a session file, default to output-root local state,
     # matching the CLI behavior.
-    session_file = _resolve_under_root(
+    session_file = _resolve_path(
         bw_cfg.get("session_file") or (rootdir / ".mailtriage" / "bw_session"),
         rootdir,
     )
@@ -171,34 +262,53 @@ def _load_bitwarden_session(policy: dict[str, Any], rootdir: Path) -> Path | Non
     return session_file
 
 
+@functools.lru_cache(maxsize=16)
+def _dns_ok(host: str, timeout: float = 3.0) -> bool:
+    # The resolver ignores socket timeouts, so bound the wait by joining a daemon
+    # thread; a dead DNS server can then no longer stall the launchd job.
+    result: list[bool] = []
+
+    def _lookup() -> None:
+        try:
+            socket.gethostbyname(host)
+            result.append(True)
+        except OSError:
+            result.append(False)
+
+    t = threading.Thread(target=_lookup, daemon=True)
+    t.start()
+    t.join(timeout)
+    return bool(result and result[0])
+
+
 def _on_vpn(host: str | None) -> bool:
     if not host:
         return True
-    try:
-        socket.gethostbyname(host)
-        return True
-    except OSError:
-        return False
+    return _dns_ok(host)
 
 
 def _download_holiday_file(url: str, target: Path) -> bool:
+    from urllib.request import urlopen
+
     target.parent.mkdir(parents=True, exist_ok=True)
+    # Stream to a sibling temp file so a failed transfer never leaves a truncated
+    # calendar behind (its presence would suppress future download attempts).
+    tmp = target.with_name(target.name + ".part")
     try:
-        with urlopen(url, timeout=25) as resp:
-            data = resp.read()
-        target.write_bytes(data)
+        with urlopen(url, timeout=25) as resp, tmp.open("wb") as f:
+            shutil.copyfileobj(resp, f, 1 << 16)
+        os.replace(tmp, target)
         return True
     except Exception:
+        tmp.unlink(missing_ok=True)
         return False
 
 
-def _resolve_path(p: str | None, root: Path) -> Path | None:
+def _resolve_path(p: str | Path | None, root: Path) -> Path | None:
     if not p:
         return None
     path = Path(p)
-    if path.is_absolute():
-        return path
-    return root / path
+    return path if path.is_absolute() else root / path
 
 
 def _is_non_workday(day: date, holiday_set: set[date]) -> bool:
@@ -222,7 +332,7 @@ def _read_dotenv(path: Path) -> dict[str, str]:
 
 def _resolve_download_url(
     dl_cfg: dict[str, Any],
-    env_vars: dict[str, str],
+    env_vars: Mapping[str, str],
 ) -> str | None:
     env_name = dl_cfg.get("url_env")
     if env_name:
@@ -241,16 +351,36 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--dry-run", action="store_true")
     ns = parser.parse_args(argv)
 
+    # Deferred until after argparse: these pull in yaml, zoneinfo and the
+    # whole ingest stack, which --help and argument errors never need.
+    from mailtriage.cli import main as mailtriage_main
+    from mailtriage.core.config import load_config
+    from mailtriage.ingest.ingest import SecretProviderError
+
     cfg = load_config(ns.config)
     repo_root = Path.cwd()
     policy = _read_policy(ns.policy)
-    dotenv_file = _resolve_path(policy.get("env_file", ".env"), repo_root)
-    dotenv_vars = _read_dotenv(dotenv_file) if dotenv_file else {}
-    merged_env = {**dotenv_vars, **os.environ}
+    paths = {
+        key: _resolve_path(policy.get(key, default), repo_root)
+        for key, default in (
+            ("env_file", ".env"),
+            ("manual_holidays_file", None),
+            ("manual_workdays_file", None),
+        )
+    }
+    ics_paths = [
+        p
+        for p in (_resolve_path(str(entry), repo_root) for entry in policy.get("ics_files") or [])
+        if p
+    ]
+    dotenv_file = paths["env_file"]
     # Make dotenv vars visible to the current process so other modules that rely on
-    # os.environ (e.g., the HTML viewer limit) see them.
-    for k, v in dotenv_vars.items():
-        os.environ.setdefault(k, v)
+    # os.environ (e.g., the HTML viewer limit) see them. Real environment wins.
+    if dotenv_file:
+        for k, v in _read_dotenv(dotenv_file).items():
+            os.environ.setdefault(k, v)
+
+    from zoneinfo import ZoneInfo
 
     tz = ZoneInfo(cfg.time.timezone)
     now_local = datetime.now(tz)
@@ -262,21 +392,33 @@ def main(argv: list[str] | None = None) -> int:
     subdiv = policy.get("subdiv")
     years = [now_local.year - 1, now_local.year, now_local.year + 1]
 
-    holiday_set = _country_holidays(country=country, subdiv=subdiv, years=years)
-
-    manual_holidays_file = _resolve_path(policy.get("manual_holidays_file"), repo_root)
-    manual_workdays_file = _resolve_path(policy.get("manual_workdays_file"), repo_root)
-
-    if manual_holidays_file:
-        holiday_set |= _parse_manual_dates(manual_holidays_file)
-    if manual_workdays_file:
-        holiday_set -= _parse_manual_dates(manual_workdays_file)
+    end_day = now_local.date()
+    notify_cfg = policy.get("notification") if isinstance(policy.get("notification"), dict) else {}
+    suppress_non_workday = bool(notify_cfg.get("suppress_on_non_workday", True))
 
-    ics_files = policy.get("ics_files") or []
-    for entry in ics_files:
-        ics_path = _resolve_path(str(entry), repo_root)
-        if ics_path:
-            holiday_set |= _parse_ics_dates(ics_path)
+    # The holiday set only decides whether today is a non-workday. A weekend already
+    # is one, so skip loading country rules and calendars on Saturday/Sunday ticks.
+    # The report itself still runs: it covers the previous day's window.
+    holiday_set: set[date] = set()
+    ics_cache_file = cfg.rootdir / ".mailtriage" / "ics-cache.pkl"
+    if end_day.weekday() < 5:
+        holiday_set = _country_holidays(
+            country=country,
+            subdiv=subdiv,
+            years=years,
+            cache_dir=cfg.rootdir / ".mailtriage",
+        )
+
+        manual_holidays_file = paths["manual_holidays_file"]
+        manual_workdays_file = paths["manual_workdays_file"]
+
+        if manual_holidays_file:
+            holiday_set |= _parse_manual_dates(manual_holidays_file)
+        if manual_workdays_file:
+            holiday_set -= _parse_manual_dates(manual_workdays_file)
+
+        if ics_paths:
+            holiday_set |= _parse_ics_files(ics_paths, set(years), ics_cache_file)
 
     dl_cfg = policy.get("holiday_download") if isinstance(policy.get("holiday_download"), dict) else {}
     if dl_cfg.get("enabled", False):
@@ -290,14 +432,14 @@ def main(argv: list[str] | None = None) -> int:
 
         if should_run_download and output_file and not output_file.exists():
             vpn_ok = _on_vpn(dl_cfg.get("vpn_check_host"))
-            url = _resolve_download_url(dl_cfg, merged_env)
+            url = _resolve_download_url(dl_cfg, os.environ)
             downloaded = False
 
             if vpn_ok and url and not ns.dry_run:
                 downloaded = _download_holiday_file(url, output_file)
 
             if output_file.exists():
-                holiday_set |= _parse_ics_dates(output_file)
+                holiday_set |= _parse_ics_files([output_file], set(years), ics_cache_file)
 
             if (
                 not downloaded
@@ -308,10 +450,6 @@ def main(argv: list[str] | None = None) -> int:
                 # install a platform notifier.
                 pass
 
-    end_day = now_local.date()
-    notify_cfg = policy.get("notification") if isinstance(policy.get("notification"), dict) else {}
-
-    suppress_non_workday = bool(notify_cfg.get("suppress_on_non_workday", True))
     is_non_workday = _is_non_workday(end_day, holiday_set)
 
     label_day = _window_label_for_now(now_local, cfg.time.workday_start)
@@ -388,9 +526,13 @@ def main(argv: list[str] | None = None) -> int:
             return 2
 
     if report_path.exists():
-        if latest_path.exists() or latest_path.is_symlink():
-            latest_path.unlink()
-        latest_path.symlink_to(report_path)
+        # Build the new link beside latest.md and rename it over the old one, so
+        # latest.md never disappears. Relative target keeps the link valid if the
+        # output root moves.
+        tmp_link = latest_path.with_suffix(".tmp")
+        tmp_link.unlink(missing_ok=True)
+        os.symlink(report_path.relative_to(cfg.rootdir), tmp_link)
+        os.replace(tmp_link, latest_path)
 
     # Minimal friction: no success notifications by default.
     notify_enabled = bool(notify_cfg.get("enabled", False))
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import argparse
+import plistlib
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 
 @dataclass(frozen=True)
@@ -21,57 +23,31 @@ class LaunchdSpec:
 def _plist(spec: LaunchdSpec) -> str:
     # Use wrapper script so logs live under output.root and are pruned.
     wrapper = (spec.repo_root / "scripts" / "run_daily_mailtriage_launchd.sh").resolve()
-    cmd = str(wrapper)
 
     if spec.weekdays_only:
         # launchd weekday: 1=Sunday ... 7=Saturday
-        intervals = "\n".join(
-            f"""      <dict>
-        <key>Weekday</key><integer>{wd}</integer>
-        <key>Hour</key><integer>{spec.hour}</integer>
-        <key>Minute</key><integer>{spec.minute}</integer>
-      </dict>"""
+        start_calendar: Any = [
+            {"Weekday": wd, "Hour": spec.hour, "Minute": spec.minute}
             for wd in (2, 3, 4, 5, 6)
-        )
-        start_calendar = f"<array>\n{intervals}\n    </array>"
+        ]
     else:
-        start_calendar = f"""<dict>
-      <key>Hour</key><integer>{spec.hour}</integer>
-      <key>Minute</key><integer>{spec.minute}</integer>
-    </dict>"""
-
-    return f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-  <dict>
-    <key>Label</key>
-    <string>{spec.label}</string>
-
-    <key>ProgramArguments</key>
-    <array>
-      <string>{cmd}</string>
-    </array>
-
-    <key>RunAtLoad</key>
-    <true/>
-
-    <key>StartCalendarInterval</key>
-    {start_calendar}
-
-    <key>EnvironmentVariables</key>
-    <dict>
-      <key>MAILTRIAGE_REPO</key><string>{spec.repo_root}</string>
-      <key>MAILTRIAGE_CONFIG</key><string>{spec.config_path}</string>
-      <key>MAILTRIAGE_POLICY</key><string>{spec.policy_path}</string>
-    </dict>
-
-    <key>StandardOutPath</key>
-    <string>/dev/null</string>
-    <key>StandardErrorPath</key>
-    <string>/dev/null</string>
-  </dict>
-</plist>
-"""
+        start_calendar = {"Hour": spec.hour, "Minute": spec.minute}
+
+    # plistlib handles XML escaping, so paths containing &, < or quotes stay valid.
+    doc = {
+        "Label": spec.label,
+        "ProgramArguments": [str(wrapper)],
+        "RunAtLoad": True,
+        "StartCalendarInterval": start_calendar,
+        "EnvironmentVariables": {
+            "MAILTRIAGE_REPO": str(spec.repo_root),
+            "MAILTRIAGE_CONFIG": str(spec.config_path),
+            "MAILTRIAGE_POLICY": str(spec.policy_path),
+        },
+        "StandardOutPath": "/dev/null",
+        "StandardErrorPath": "/dev/null",
+    }
+    return plistlib.dumps(doc, sort_keys=False).decode("utf-8")
 
 
 def main(argv: list[str] | None = None) -> int:
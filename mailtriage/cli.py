@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import queue
 import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Iterable
 import os
 
 from mailtriage.core.config import load_config
@@ -13,7 +17,7 @@ from mailtriage.core.notify import notify
 from mailtriage.core.schema import ensure_schema_v1, verify_schema_hash
 from mailtriage.core.timewindow import compute_windows
 from mailtriage.ingest.ingest import SecretProviderError
-from mailtriage.ingest.ingest import ingest_account
+from mailtriage.ingest.ingest import build_imap_account, ingest_account, known_message_ids
 from mailtriage.render.window import render_window
 from mailtriage.render.site import render_index
 from mailtriage.watch.notify_unreplied import UnrepliedRule as _UnrepliedRuleCfg
@@ -21,7 +25,7 @@ from mailtriage.watch.notify_unreplied import UnrepliedWatchConfig as _Unreplied
 from mailtriage.watch.notify_unreplied import run_unreplied_watch
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Args:
     config: Path
     days: int | None
@@ -55,10 +59,109 @@ def build_parser() -> argparse.ArgumentParser:
     return p
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_utc_z(ts: str) -> datetime:
     if not ts.endswith("Z"):
         raise ValueError(f"Expected UTC Z timestamp, got: {ts}")
-    return datetime.fromisoformat(ts[:-1]).replace(tzinfo=timezone.utc)
+    # fromisoformat accepts the trailing Z natively (3.11+) and yields UTC.
+    return datetime.fromisoformat(ts)
+
+
+# (sql, params) for exec, or (sql, rows) with many=True for exec_many.
+_Write = tuple[str, tuple[object, ...] | list[tuple[object, ...]], bool]
+
+
+class _QueuedWrites:
+    """
+    Stand-in for Database handed to ingest worker threads. sqlite3 connections
+    must stay on the thread that owns them, so writes are queued and replayed
+    on the main thread in submission order.
+    """
+
+    def __init__(self, q: queue.Queue[_Write]) -> None:
+        self._q = q
+
+    def exec(self, sql: str, params: tuple[object, ...] = ()) -> None:
+        self._q.put((sql, params, False))
+
+    def exec_many(self, sql: str, rows: Iterable[tuple[object, ...]]) -> None:
+        self._q.put((sql, list(rows), True))
+
+
+def _drain_writes(q: queue.Queue[_Write], db: Database) -> None:
+    while True:
+        try:
+            sql, params, many = q.get_nowait()
+        except queue.Empty:
+            return
+        if many:
+            db.exec_many(sql, params)
+        else:
+            db.exec(sql, params)
+
+
+def _ingest_accounts(
+    db: Database,
+    accounts: list,
+    *,
+    window_start_utc: datetime,
+    window_end_utc: datetime,
+    fetch_batch_size: int,
+) -> None:
+    # Read on this thread: workers only ever see the write sink.
+    known_ids = known_message_ids(db, window_start_utc, window_end_utc)
+
+    if len(accounts) <= 1:
+        for acct in accounts:
+            ingest_account(
+                db=db,
+                account_cfg=acct,
+                window_start_utc=window_start_utc,
+                window_end_utc=window_end_utc,
+                fetch_batch_size=fetch_batch_size,
+                known_ids=known_ids,
+            )
+        return
+
+    errors: list[BaseException] = []
+    # Resolve secrets serially on this thread: `bw` unlock/get share
+    # BW_SESSION through os.environ and must not run concurrently.
+    resolved = []
+    for acct in accounts:
+        try:
+            resolved.append((acct, build_imap_account(account_cfg=acct)))
+        except Exception as e:
+            errors.append(e)
+
+    # IMAP ingestion is network-bound: fetch accounts concurrently, write serially.
+    writes: queue.Queue[_Write] = queue.Queue()
+    sink = _QueuedWrites(writes)
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(resolved)))) as ex:
+        pending = {
+            ex.submit(
+                ingest_account,
+                db=sink,
+                account_cfg=acct,
+                window_start_utc=window_start_utc,
+                window_end_utc=window_end_utc,
+                fetch_batch_size=fetch_batch_size,
+                known_ids=known_ids,
+                imap_account=imap_account,
+            )
+            for acct, imap_account in resolved
+        }
+        while pending:
+            done, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+            _drain_writes(writes, db)
+            for f in done:
+                exc = f.exception()
+                if exc is not None:
+                    errors.append(exc)
+    _drain_writes(writes, db)
+
+    if errors:
+        # Secrets problems take precedence so the caller can prompt for an unlock.
+        raise next((e for e in errors if isinstance(e, SecretProviderError)), errors[0])
 
 
 def _maybe_load_bw_session(*, output_root: Path) -> None:
@@ -124,8 +227,8 @@ def main(argv: list[str] | None = None) -> int:
 
         if ns.command == "run":
             windows = compute_windows(
-                timezone=cfg.time.timezone,
-                workday_start=cfg.time.workday_start,
+                timezone=cfg.time.tz,
+                workday_start=cfg.time.workday_start_hm,
                 days=args.days,
                 date=args.date,
             )
@@ -145,22 +248,22 @@ def main(argv: list[str] | None = None) -> int:
 
             windows = [_W(start_utc, now_utc)]
 
-        # optional bookkeeping
-        for w in windows:
-            db.record_run_window(w.start_utc, w.end_utc)
+        # optional bookkeeping; nothing reads run_log, so it is opt-in
+        if cfg.watch.record_run_log:
+            db.record_run_windows([(w.start_utc, w.end_utc) for w in windows])
 
         try:
             for w in windows:
                 start_dt = _parse_utc_z(w.start_utc)
                 end_dt = _parse_utc_z(w.end_utc)
 
-                for acct in cfg.accounts:
-                    ingest_account(
-                        db=db,
-                        account_cfg=acct,
-                        window_start_utc=start_dt,
-                        window_end_utc=end_dt,
-                    )
+                _ingest_accounts(
+                    db,
+                    cfg.accounts,
+                    window_start_utc=start_dt,
+                    window_end_utc=end_dt,
+                    fetch_batch_size=cfg.watch.fetch_batch_size,
+                )
 
                 if ns.command == "run":
                     render_window(
@@ -169,7 +272,7 @@ def main(argv: list[str] | None = None) -> int:
                         window_end_utc=end_dt,
                         rootdir=rootdir,
                         rules=cfg.rules,
-                        timezone=cfg.time.timezone,
+                        timezone=cfg.time.tz,
                     )
         except SecretProviderError as e:
             # Best-effort: show a desktop notification in addition to the error.
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
+from itertools import repeat
 from pathlib import Path
 from typing import Any, List
+from zoneinfo import ZoneInfo
 
 import yaml
 
+from mailtriage.core.timewindow import parse_hhmm
+
 
 class ConfigError(ValueError):
     pass
@@ -20,6 +25,9 @@ class OutputConfig:
 class TimeConfig:
     timezone: str
     workday_start: str  # HH:MM
+    # Parsed once at load time so callers don't re-parse per window.
+    tz: ZoneInfo = field(repr=False, compare=False)
+    workday_start_hm: tuple[int, int] = field(repr=False, compare=False)
 
 
 @dataclass(frozen=True)
@@ -94,6 +102,8 @@ class UnrepliedWatchConfig:
 @dataclass(frozen=True)
 class WatchConfig:
     ingest_lookback_days: int = 7
+    fetch_batch_size: int = 100  # max messages per IMAP FETCH command
+    record_run_log: bool = False  # write processed windows to run_log
     unreplied: UnrepliedWatchConfig = field(default_factory=UnrepliedWatchConfig)
 
 
@@ -107,7 +117,12 @@ class AppConfig:
     watch: WatchConfig
 
     def state_db_path(self) -> Path:
-        return self.rootdir / ".mailtriage" / "state.db"
+        return _state_db_path(self.rootdir)
+
+
+@functools.lru_cache(maxsize=8)
+def _state_db_path(rootdir: Path) -> Path:
+    return rootdir / ".mailtriage" / "state.db"
 
 
 def _require(d: dict[str, Any], k: str) -> Any:
@@ -116,27 +131,78 @@ def _require(d: dict[str, Any], k: str) -> Any:
     return d[k]
 
 
-def _reject_unknown(d: dict[str, Any], allowed: set[str], context: str) -> None:
+def _reject_unknown(
+    d: dict[str, Any], allowed: frozenset[str], context: str
+) -> None:
     unknown = set(d.keys()) - allowed
     if unknown:
         keys = ", ".join(sorted(unknown))
         raise ConfigError(f"Unknown key(s) in {context}: {keys}")
 
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _check_str_list(value: Any, context: str) -> list[str]:
+    # map(isinstance, ...) keeps the per-item check in C
+    if not isinstance(value, list) or not all(map(isinstance, value, repeat(str))):
+        raise ConfigError(f"{context} must be a list of strings")
+    return value
+
+
+# Allowed keys per config section, built once.
+_ROOT_KEYS = frozenset({"output", "time", "accounts", "rules", "tickets", "watch"})
+_OUTPUT_KEYS = frozenset({"root"})
+_WATCH_KEYS = frozenset(
+    {"unreplied", "ingest_lookback_days", "fetch_batch_size", "record_run_log"}
+)
+_UNREPLIED_KEYS = frozenset({"enabled", "rules"})
+_UNREPLIED_RULE_KEYS = frozenset(
+    {
+        "id",
+        "target_addresses",
+        "unreplied_after_minutes",
+        "lookback_days",
+        "notify_cooldown_minutes",
+    }
+)
+_TIME_KEYS = frozenset({"timezone", "workday_start"})
+_ACCOUNT_KEYS = frozenset({"id", "imap", "identity", "secrets"})
+_IMAP_KEYS = frozenset({"host", "port", "ssl", "folders"})
+_IDENTITY_KEYS = frozenset({"primary_address", "aliases"})
+_SECRETS_KEYS = frozenset({"provider", "reference"})
+_RULES_KEYS = frozenset(
+    {"high_priority_senders", "collapse_automated", "suppress", "arrival_only"}
+)
+_SENDER_SUBJECT_KEYS = frozenset({"senders", "subjects"})
+_TICKETS_KEYS = frozenset({"enabled", "plugins"})
+
+
 def load_config(path: Path) -> AppConfig:
     if not path.exists():
         raise ConfigError(f"Config not found: {path}")
 
-    raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+    # Re-parse the YAML only when the file changes (watch/test loops reload
+    # often). The AppConfig is rebuilt per call: its lists are mutable, so
+    # callers must not share one instance.
+    st = path.stat()
+    return _build_config(_read_yaml_cached(path.resolve(), st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=8)
+def _read_yaml_cached(path: Path, _mtime_ns: int, _size: int) -> Any:
+    # Shared between calls: _build_config only reads it.
+    return yaml.load(path.read_text(encoding="utf-8"), Loader=_YAML_LOADER)
+
+
+def _build_config(raw: Any) -> AppConfig:
     if not isinstance(raw, dict):
         raise ConfigError("Config must be a YAML mapping at top-level")
 
-    _reject_unknown(
-        raw, {"output", "time", "accounts", "rules", "tickets", "watch"}, "root config"
-    )
+    _reject_unknown(raw, _ROOT_KEYS, "root config")
 
     output_raw = raw.get("output")
-    _reject_unknown(output_raw, {"root"}, "output")
+    _reject_unknown(output_raw, _OUTPUT_KEYS, "output")
     if not output_raw or "root" not in output_raw:
         raise ConfigError("output.root is required and must be an absolute path")
 
@@ -152,16 +218,12 @@ def load_config(path: Path) -> AppConfig:
     watch_raw = raw.get("watch", {}) or {}
     if not isinstance(watch_raw, dict):
         raise ConfigError("watch must be a mapping")
-    _reject_unknown(watch_raw, {"unreplied", "ingest_lookback_days"}, "watch")
+    _reject_unknown(watch_raw, _WATCH_KEYS, "watch")
 
     unreplied_raw = watch_raw.get("unreplied", {}) or {}
     if not isinstance(unreplied_raw, dict):
         raise ConfigError("watch.unreplied must be a mapping")
-    _reject_unknown(
-        unreplied_raw,
-        {"enabled", "rules"},
-        "watch.unreplied",
-    )
+    _reject_unknown(unreplied_raw, _UNREPLIED_KEYS, "watch.unreplied")
 
     watch_rules_raw = unreplied_raw.get("rules") or []
     if not isinstance(watch_rules_raw, list):
@@ -171,28 +233,15 @@ def load_config(path: Path) -> AppConfig:
     for rr in watch_rules_raw:
         if not isinstance(rr, dict):
             raise ConfigError("each watch.unreplied.rules entry must be a mapping")
-        _reject_unknown(
-            rr,
-            {
-                "id",
-                "target_addresses",
-                "unreplied_after_minutes",
-                "lookback_days",
-                "notify_cooldown_minutes",
-            },
-            "watch.unreplied.rules[]",
-        )
+        _reject_unknown(rr, _UNREPLIED_RULE_KEYS, "watch.unreplied.rules[]")
         rid = str(_require(rr, "id")).strip()
         if not rid:
             raise ConfigError("watch.unreplied.rules[].id must be non-empty")
 
-        target_addresses = rr.get("target_addresses") or []
-        if not isinstance(target_addresses, list) or not all(
-            isinstance(x, str) for x in target_addresses
-        ):
-            raise ConfigError(
-                "watch.unreplied.rules[].target_addresses must be a list of strings"
-            )
+        target_addresses = _check_str_list(
+            rr.get("target_addresses") or [],
+            "watch.unreplied.rules[].target_addresses",
+        )
 
         rules.append(
             UnrepliedRuleConfig(
@@ -211,14 +260,40 @@ def load_config(path: Path) -> AppConfig:
         rules=rules,
     )
     ingest_lookback_days = int(watch_raw.get("ingest_lookback_days", 7) or 7)
-    watch_cfg = WatchConfig(ingest_lookback_days=ingest_lookback_days, unreplied=unreplied_watch)
+    fetch_batch_raw = watch_raw.get("fetch_batch_size", 100)
+    try:
+        if isinstance(fetch_batch_raw, (bool, float)):
+            raise TypeError(fetch_batch_raw)
+        fetch_batch_size = int(fetch_batch_raw)
+    except (TypeError, ValueError) as e:
+        raise ConfigError("watch.fetch_batch_size must be an integer") from e
+    if fetch_batch_size < 1:
+        raise ConfigError("watch.fetch_batch_size must be >= 1")
+    watch_cfg = WatchConfig(
+        ingest_lookback_days=ingest_lookback_days,
+        fetch_batch_size=fetch_batch_size,
+        record_run_log=bool(watch_raw.get("record_run_log", False)),
+        unreplied=unreplied_watch,
+    )
 
     if not isinstance(time_raw, dict):
         raise ConfigError("time must be a mapping")
-    _reject_unknown(time_raw, {"timezone", "workday_start"}, "time")
+    _reject_unknown(time_raw, _TIME_KEYS, "time")
+    timezone_name = str(_require(time_raw, "timezone"))
+    workday_start = str(_require(time_raw, "workday_start"))
+    try:
+        tz = ZoneInfo(timezone_name)
+    except (KeyError, ValueError) as e:
+        raise ConfigError(f"time.timezone is not a known zone: {timezone_name}") from e
+    try:
+        workday_start_hm = parse_hhmm(workday_start)
+    except ValueError as e:
+        raise ConfigError("time.workday_start must be HH:MM (00:00-23:59)") from e
     time_cfg = TimeConfig(
-        timezone=str(_require(time_raw, "timezone")),
-        workday_start=str(_require(time_raw, "workday_start")),
+        timezone=timezone_name,
+        workday_start=workday_start,
+        tz=tz,
+        workday_start_hm=workday_start_hm,
     )
 
     if not isinstance(accounts_raw, list) or not accounts_raw:
@@ -228,7 +303,7 @@ def load_config(path: Path) -> AppConfig:
     for a in accounts_raw:
         if not isinstance(a, dict):
             raise ConfigError("each account must be a mapping")
-        _reject_unknown(a, {"id", "imap", "identity", "secrets"}, "account")
+        _reject_unknown(a, _ACCOUNT_KEYS, "account")
 
         imap_raw = _require(a, "imap")
         identity_raw = _require(a, "identity")
@@ -236,12 +311,10 @@ def load_config(path: Path) -> AppConfig:
 
         if not isinstance(imap_raw, dict):
             raise ConfigError("account.imap must be a mapping")
-        _reject_unknown(imap_raw, {"host", "port", "ssl", "folders"}, "account.imap")
-        folders = imap_raw.get("folders") or ["INBOX"]
-        if not isinstance(folders, list) or not all(
-            isinstance(x, str) for x in folders
-        ):
-            raise ConfigError("account.imap.folders must be a list of strings")
+        _reject_unknown(imap_raw, _IMAP_KEYS, "account.imap")
+        folders = _check_str_list(
+            imap_raw.get("folders") or ["INBOX"], "account.imap.folders"
+        )
         imap_cfg = ImapConfig(
             host=str(_require(imap_raw, "host")),
             port=int(_require(imap_raw, "port")),
@@ -251,14 +324,10 @@ def load_config(path: Path) -> AppConfig:
 
         if not isinstance(identity_raw, dict):
             raise ConfigError("account.identity must be a mapping")
-        _reject_unknown(
-            identity_raw, {"primary_address", "aliases"}, "account.identity"
+        _reject_unknown(identity_raw, _IDENTITY_KEYS, "account.identity")
+        aliases = _check_str_list(
+            identity_raw.get("aliases") or [], "account.identity.aliases"
         )
-        aliases = identity_raw.get("aliases") or []
-        if not isinstance(aliases, list) or not all(
-            isinstance(x, str) for x in aliases
-        ):
-            raise ConfigError("account.identity.aliases must be a list of strings")
         identity_cfg = IdentityConfig(
             primary_address=str(_require(identity_raw, "primary_address")),
             aliases=[str(x) for x in aliases],
@@ -266,7 +335,7 @@ def load_config(path: Path) -> AppConfig:
 
         if not isinstance(secrets_raw, dict):
             raise ConfigError("account.secrets must be a mapping")
-        _reject_unknown(secrets_raw, {"provider", "reference"}, "account.secrets")
+        _reject_unknown(secrets_raw, _SECRETS_KEYS, "account.secrets")
         secrets_cfg = SecretsConfig(
             provider=str(_require(secrets_raw, "provider")),
             reference=str(_require(secrets_raw, "reference")),
@@ -283,20 +352,16 @@ def load_config(path: Path) -> AppConfig:
 
     if not isinstance(rules_raw, dict):
         raise ConfigError("rules must be a mapping")
-    _reject_unknown(
-        rules_raw,
-        {"high_priority_senders", "collapse_automated", "suppress", "arrival_only"},
-        "rules",
-    )
+    _reject_unknown(rules_raw, _RULES_KEYS, "rules")
 
     suppress_raw = rules_raw.get("suppress", {}) or {}
     arrival_raw = rules_raw.get("arrival_only", {}) or {}
-    _reject_unknown(suppress_raw, {"senders", "subjects"}, "rules.suppress")
-    _reject_unknown(arrival_raw, {"senders", "subjects"}, "rules.arrival_only")
+    _reject_unknown(suppress_raw, _SENDER_SUBJECT_KEYS, "rules.suppress")
+    _reject_unknown(arrival_raw, _SENDER_SUBJECT_KEYS, "rules.arrival_only")
 
-    hp = rules_raw.get("high_priority_senders") or []
-    if not isinstance(hp, list) or not all(isinstance(x, str) for x in hp):
-        raise ConfigError("rules.high_priority_senders must be a list of strings")
+    hp = _check_str_list(
+        rules_raw.get("high_priority_senders") or [], "rules.high_priority_senders"
+    )
     rules_cfg = RulesConfig(
         high_priority_senders=[str(x) for x in hp],
         collapse_automated=bool(rules_raw.get("collapse_automated", True)),
@@ -312,10 +377,8 @@ def load_config(path: Path) -> AppConfig:
 
     if not isinstance(tickets_raw, dict):
         raise ConfigError("tickets must be a mapping")
-    _reject_unknown(tickets_raw, {"enabled", "plugins"}, "tickets")
-    plugins = tickets_raw.get("plugins") or []
-    if not isinstance(plugins, list) or not all(isinstance(x, str) for x in plugins):
-        raise ConfigError("tickets.plugins must be a list of strings")
+    _reject_unknown(tickets_raw, _TICKETS_KEYS, "tickets")
+    plugins = _check_str_list(tickets_raw.get("plugins") or [], "tickets.plugins")
     tickets_cfg = TicketsConfig(
         enabled=bool(tickets_raw.get("enabled", False)),
         plugins=[str(x) for x in plugins],
@@ -4,6 +4,7 @@ import sqlite3
 from contextlib import AbstractContextManager
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable
 
 
 class DatabaseError(RuntimeError):
@@ -22,6 +23,12 @@ class Database(AbstractContextManager["Database"]):
         conn.execute("PRAGMA journal_mode=WAL;")
         conn.execute("PRAGMA synchronous=NORMAL;")
         conn.execute("PRAGMA foreign_keys=ON;")
+        # Bulk ingest: bigger page cache, mmap reads, in-memory temp tables
+        conn.execute("PRAGMA cache_size=-65536;")
+        conn.execute("PRAGMA mmap_size=268435456;")
+        conn.execute("PRAGMA temp_store=MEMORY;")
+        conn.execute("PRAGMA wal_autocheckpoint=2000;")
+        conn.execute("PRAGMA busy_timeout=5000;")
         return cls(conn=conn)
 
     def __exit__(self, exc_type, exc, tb) -> None:
@@ -36,6 +43,13 @@ class Database(AbstractContextManager["Database"]):
     def exec(self, sql: str, params: tuple[object, ...] = ()) -> None:
         self.conn.execute(sql, params)
 
+    def exec_many(self, sql: str, rows: Iterable[tuple[object, ...]]) -> None:
+        self.conn.executemany(sql, rows)
+
+    def exec_script(self, sql: str) -> None:
+        # Parses and runs every statement in one call (commits first).
+        self.conn.executescript(sql)
+
     def query_one(
         self, sql: str, params: tuple[object, ...] = ()
     ) -> sqlite3.Row | None:
@@ -50,7 +64,12 @@ class Database(AbstractContextManager["Database"]):
 
     def record_run_window(self, start_utc: str, end_utc: str) -> None:
         # Optional bookkeeping; harmless if unused.
-        self.conn.execute(
-            "INSERT INTO run_log (start_utc, end_utc, recorded_at_utc) VALUES (?, ?, strftime('%Y-%m-%dT%H:%M:%SZ','now'))",
-            (start_utc, end_utc),
-        )
+        self.record_run_windows([(start_utc, end_utc)])
+
+    def record_run_windows(self, windows: list[tuple[str, str]]) -> None:
+        # One prepared statement and one commit for the whole batch.
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO run_log (start_utc, end_utc, recorded_at_utc) VALUES (?, ?, strftime('%Y-%m-%dT%H:%M:%SZ','now'))",
+                windows,
+            )
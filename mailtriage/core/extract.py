@@ -1,38 +1,35 @@
 from __future__ import annotations
 
+import codecs
+import functools
 import html as _html
 import re
 from dataclasses import dataclass
+from email.header import decode_header, make_header
 from email.message import Message
 
 __all__ = [
     "ExtractedContent",
     "select_body",
+    "scan_message",
     "extract_new_text",
     "extract_attachment_names",
 ]
 
 _TAG_RE = re.compile(r"<[^>]+>")
 _SCRIPT_STYLE_RE = re.compile(r"(?is)<(script|style).*?>.*?</\1>")
-_BR_RE = re.compile(r"(?i)<br\s*/?>")
-_BLOCK_END_RE = re.compile(r"(?i)</(p|div|li|tr|h1|h2|h3|h4|h5|h6)>")
-
-_HTML_MARKERS = (
-    "<html",
-    "<head",
-    "<body",
-    "<style",
-    "<script",
-    "<table",
-    "<div",
-    "<span",
-    "<meta",
-    "<!doctype",
-)
-
-_QUOTE_MARKERS = (
-    ">",
-    "on ",
+# <br> and closing block tags both become a newline: one pass for both.
+_BREAK_RE = re.compile(r"(?i)<(?:br\s*/?|/(?:p|div|li|tr|h[1-6]))>")
+_NEWLINE_RE = re.compile(r"\r\n?")
+_TRAILING_WS_RE = re.compile(r"[^\S\n]+$", re.M)
+_BLANK_RUN_RE = re.compile(r"\n{4,}")
+_NL_COLLAPSE_RE = re.compile(r"\n{3,}")
+# Every character str.splitlines() breaks on.
+_LINE_BREAK_RE = re.compile(r"[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]")
+
+# One case-insensitive scan instead of a substring test per marker.
+_HTML_MARKERS_RE = re.compile(
+    r"<(?:html|head|body|style|script|table|div|span|meta|!doctype)", re.I
 )
 
 _SIGNATURE_MARKERS = (
@@ -59,33 +56,53 @@ def _decode_part(part: Message) -> str:
     if not isinstance(payload, (bytes, bytearray)):
         return ""
 
-    charset = part.get_content_charset() or "utf-8"
+    codec = _codec_for(part.get_content_charset())
+    # Most bodies are plain ASCII; skip charset decoding for them when the
+    # declared codec agrees with ASCII (not e.g. utf-16 / utf-7).
+    if payload.isascii() and _ascii_compatible(codec):
+        return payload.decode("ascii")
+    return payload.decode(codec, errors="replace")
+
+
+@functools.lru_cache(maxsize=64)
+def _codec_for(charset: str | None) -> str:
+    # Resolve each declared charset once; unknown or non-text codecs -> utf-8.
+    if not charset:
+        return "utf-8"
     try:
-        return payload.decode(charset, errors="replace")
+        b"\x00".decode(charset, errors="replace")
     except LookupError:
-        return payload.decode("utf-8", errors="replace")
+        return "utf-8"
+    return codecs.lookup(charset).name
+
+
+@functools.lru_cache(maxsize=64)
+def _ascii_compatible(codec: str) -> bool:
+    ascii_bytes = bytes(range(128))
+    try:
+        return ascii_bytes.decode(codec) == ascii_bytes.decode("ascii")
+    except UnicodeDecodeError:
+        return False
 
 
 def looks_like_html(text: str) -> bool:
     if not text:
         return False
 
-    sample = text.lstrip()[:2048].lower()
-
-    return any(marker in sample for marker in _HTML_MARKERS)
+    return _HTML_MARKERS_RE.search(text.lstrip()[:2048]) is not None
 
 
 def html_to_text(s: str) -> str:
     if not s:
         return ""
     s = _SCRIPT_STYLE_RE.sub("", s)
-    s = _BR_RE.sub("\n", s)
-    s = _BLOCK_END_RE.sub("\n", s)
+    s = _BREAK_RE.sub("\n", s)
     s = _TAG_RE.sub("", s)
     s = _html.unescape(s)
     # normalize whitespace
-    s = s.replace("\r\n", "\n").replace("\r", "\n")
-    s = re.sub(r"\n{3,}", "\n\n", s)
+    if "\r" in s:
+        s = _NEWLINE_RE.sub("\n", s)
+    s = _NL_COLLAPSE_RE.sub("\n\n", s)
     s = "\n".join(line.strip() for line in s.splitlines())
     return s.strip()
 
@@ -95,54 +112,103 @@ def select_body(msg: Message) -> tuple[str, bool]:
     Returns (text, is_html_source).
     Always returns *plain text* suitable for Markdown.
     """
-    text_plain: str | None = None
-    text_html: str | None = None
+    plain_seen = False
+    html_part: Message | None = None
+
+    # Pre-order DFS (same order as msg.walk()), stopping at the first usable
+    # text/plain part. Only the first text/plain and text/html parts count.
+    stack = [msg]
+    while stack:
+        part = stack.pop()
+        if part.is_multipart():
+            stack.extend(reversed(part.get_payload()))
+            continue
 
-    if msg.is_multipart():
-        for part in msg.walk():
-            ctype = (part.get_content_type() or "").lower()
-            disp = (part.get("Content-Disposition") or "").lower()
+        ctype = (part.get_content_type() or "").lower()
+        if ctype not in ("text/plain", "text/html"):
+            continue
+
+        # skip attachments (a single-part message is always its own body)
+        if part is not msg and "attachment" in (
+            part.get("Content-Disposition") or ""
+        ).lower():
+            continue
 
-            # skip attachments
-            if "attachment" in disp:
+        if ctype == "text/plain":
+            if plain_seen:
                 continue
+            plain_seen = True
+            text_plain = _decode_part(part)
+            if text_plain.strip() and not looks_like_html(text_plain):
+                return text_plain, False
+            if html_part is not None:
+                break
+        elif html_part is None:
+            html_part = part
+            if plain_seen:
+                break
+
+    if html_part is not None:
+        text_html = _decode_part(html_part)
+        if text_html.strip():
+            return html_to_text(text_html), True
 
-            if ctype == "text/plain" and text_plain is None:
-                text_plain = _decode_part(part)
+    return "", False
 
-            elif ctype == "text/html" and text_html is None:
-                text_html = _decode_part(part)
-    else:
-        ctype = (msg.get_content_type() or "").lower()
-        if ctype == "text/plain":
-            text_plain = _decode_part(msg)
-        elif ctype == "text/html":
-            text_html = _decode_part(msg)
 
-    if text_plain and text_plain.strip():
-        if not looks_like_html(text_plain):
-            return text_plain, False
+def scan_message(msg: Message) -> tuple[str, bool, list[str]]:
+    """
+    One MIME traversal for ingest: (body_text, is_html_source, attachment_names),
+    equal to select_body(msg) + extract_attachment_names(msg).
+    """
+    multipart = msg.is_multipart()
+    names: list[str] = []
+    plain_part: Message | None = None
+    html_part: Message | None = None
 
-    if text_html and text_html.strip():
-        return html_to_text(text_html), True
+    stack = [msg]
+    while stack:
+        part = stack.pop()
+        if multipart and part.get_content_disposition() == "attachment":
+            fn = part.get_filename()
+            if fn:
+                names.append(_decode_filename(fn) if "=?" in fn else fn)
+        if part.is_multipart():
+            stack.extend(reversed(part.get_payload()))
+            continue
 
-    return "", False
+        if plain_part is not None and html_part is not None:
+            continue
+        ctype = (part.get_content_type() or "").lower()
+        if ctype not in ("text/plain", "text/html"):
+            continue
+        if part is not msg and "attachment" in (
+            part.get("Content-Disposition") or ""
+        ).lower():
+            continue
+        if ctype == "text/plain":
+            if plain_part is None:
+                plain_part = part
+        elif html_part is None:
+            html_part = part
+
+    if plain_part is not None:
+        text_plain = _decode_part(plain_part)
+        if text_plain.strip() and not looks_like_html(text_plain):
+            return text_plain, False, names
+    if html_part is not None:
+        text_html = _decode_part(html_part)
+        if text_html.strip():
+            return html_to_text(text_html), True, names
+    return "", False, names
 
 
 def normalize_text(text: str) -> str:
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    lines = [ln.rstrip() for ln in text.split("\n")]
-    out: list[str] = []
-    blank = 0
-    for ln in lines:
-        if ln.strip() == "":
-            blank += 1
-            if blank <= 2:
-                out.append("")
-        else:
-            blank = 0
-            out.append(ln)
-    return "\n".join(out).strip()
+    text = _NEWLINE_RE.sub("\n", text)
+    text = _TRAILING_WS_RE.sub("", text)
+    # keep at most two blank lines in a row
+    text = _BLANK_RUN_RE.sub("\n\n\n", text)
+    return text.strip()
 
 
 def normalize_excerpt(
@@ -154,21 +220,34 @@ def normalize_excerpt(
     if not s:
         return ""
 
+    # Short single-line text (the common case): no split/join needed.
+    if len(s) <= max_chars and _LINE_BREAK_RE.search(s) is None:
+        ln = s.strip()
+        if not ln or ln.startswith(">"):
+            return ""
+        low = ln.lower()
+        if (low.startswith("on ") and "wrote:" in low) or low.startswith(
+            _SIGNATURE_MARKERS
+        ):
+            return ""
+        return ln
+
     lines_out: list[str] = []
     for raw in s.splitlines():
         ln = raw.strip()
         if not ln:
             continue
 
-        low = ln.lower()
-
         if ln.startswith(">"):
             break
 
+        low = ln.lower()
+
         if low.startswith("on ") and "wrote:" in low:
             break
 
-        if low in _SIGNATURE_MARKERS or low.startswith(_SIGNATURE_MARKERS):
+        # exact matches are covered by the tuple startswith
+        if low.startswith(_SIGNATURE_MARKERS):
             break
 
         lines_out.append(ln)
@@ -189,7 +268,7 @@ def strip_structured_blocks(text: str) -> tuple[str, bool]:
 
     in_block = True
     for ln in lines:
-        if in_block and (ln.startswith(" ") or ":" in ln[:20]):
+        if in_block and (ln[:1] == " " or ln.find(":", 0, 20) != -1):
             structured = True
             continue
         in_block = False
@@ -198,16 +277,25 @@ def strip_structured_blocks(text: str) -> tuple[str, bool]:
     return "\n".join(result).strip(), structured
 
 
-QUOTE_PREFIXES = ("on ", "from:", "sent:", "-----original message-----")
+# Same test as ln.lower().strip().startswith(">" | "on " | "from:" | ...),
+# done in one C-level match per line.
+_QUOTE_RE = re.compile(
+    r"\s*(?:>|on .*\S|from:|sent:|-----original message-----)", re.I
+)
+
+
+# _QUOTE_RE plus the "--" signature separator, so the fused pass tests each
+# line once; the `sig` group tells the two apart.
+_CUT_RE = re.compile(
+    r"\s*(?:(?P<sig>--\s*$)|>|on .*\S|from:|sent:|-----original message-----)",
+    re.I,
+)
 
 
 def strip_quotes(text: str) -> tuple[str, bool]:
     lines = text.split("\n")
     for i, ln in enumerate(lines):
-        low = ln.lower().strip()
-        if low.startswith(">"):
-            return "\n".join(lines[:i]).strip(), True
-        if any(low.startswith(p) for p in QUOTE_PREFIXES):
+        if _QUOTE_RE.match(ln):
             return "\n".join(lines[:i]).strip(), True
     return text, False
 
@@ -220,6 +308,50 @@ def strip_signature(text: str) -> tuple[str, bool]:
     return text, False
 
 
+def _extract_fused(body: str) -> tuple[str, bool, bool, bool]:
+    """
+    Single-pass equivalent of normalize_text -> strip_structured_blocks ->
+    strip_quotes -> strip_signature. Cut points are found on the raw lines;
+    only the kept slice is whitespace-normalized.
+    Returns (text, structured, trimmed_quote, trimmed_sig).
+    """
+    if "\r" in body:
+        body = _NEWLINE_RE.sub("\n", body)
+    lines = body.strip().split("\n")
+    n = len(lines)
+
+    start = 0
+    while start < n:
+        ln = lines[start]
+        # whitespace-only lines are blank once normalized, so they end the block
+        if not (
+            (ln[:1] == " " and not ln.isspace()) or ln.find(":", 0, 20) != -1
+        ):
+            break
+        start += 1
+
+    end = n
+    trimmed_q = trimmed_s = False
+    for i in range(start, n):
+        m = _CUT_RE.match(lines[i])
+        if m is not None:
+            end = i
+            if m.group("sig") is None:
+                trimmed_q = True
+            else:
+                trimmed_s = True
+            break
+
+    if trimmed_s:
+        # a quote further down is still cut (and reported) by the sequential form
+        trimmed_q = any(_QUOTE_RE.match(lines[i]) for i in range(end + 1, n))
+
+    text = "\n".join(lines[start:end])
+    text = _TRAILING_WS_RE.sub("", text)
+    text = _BLANK_RUN_RE.sub("\n\n\n", text)
+    return text.strip(), start > 0, trimmed_q, trimmed_s
+
+
 def extract_new_text(*, subject: str, body: str | None) -> ExtractedContent:
     if body is None or body.strip() == "":
         if subject.strip():
@@ -232,10 +364,7 @@ def extract_new_text(*, subject: str, body: str | None) -> ExtractedContent:
             )
         return ExtractedContent("none", "", False, False, False)
 
-    text = normalize_text(body)
-    text, structured = strip_structured_blocks(text)
-    text, trimmed_q = strip_quotes(text)
-    text, trimmed_s = strip_signature(text)
+    text, structured, trimmed_q, trimmed_s = _extract_fused(body)
 
     if not text and subject.strip():
         return ExtractedContent(
@@ -255,13 +384,28 @@ def extract_new_text(*, subject: str, body: str | None) -> ExtractedContent:
     )
 
 
+@functools.lru_cache(maxsize=1024)
+def _decode_filename(fn: str) -> str:
+    # RFC 2047 encoded-words in filename params (common from Outlook/Gmail)
+    try:
+        return str(make_header(decode_header(fn)))
+    except Exception:
+        return fn
+
+
 def extract_attachment_names(msg: Message) -> list[str]:
     names: list[str] = []
     if not msg.is_multipart():
         return names
-    for part in msg.walk():
+    # Explicit pre-order DFS; same order as msg.walk() without the generator.
+    stack = [msg]
+    while stack:
+        part = stack.pop()
+        # forwarded message/rfc822 parts can be attachments and containers
         if part.get_content_disposition() == "attachment":
             fn = part.get_filename()
             if fn:
-                names.append(fn)
+                names.append(_decode_filename(fn) if "=?" in fn else fn)
+        if part.is_multipart():
+            stack.extend(reversed(part.get_payload()))
     return names
@@ -87,20 +87,28 @@ CREATE TABLE IF NOT EXISTS run_log (
 """.strip()
 
 
+# The schema text is a constant, so its digest is too.
+_SCHEMA_HASH = hashlib.sha256(SCHEMA_V1_SQL.encode("utf-8")).hexdigest()
+
+
 def schema_hash() -> str:
-    h = hashlib.sha256()
-    h.update(SCHEMA_V1_SQL.encode("utf-8"))
-    return h.hexdigest()
+    return _SCHEMA_HASH
 
 
 def ensure_schema_v1(db: Database, timezone: str, workday_start: str) -> None:
     # Create tables (idempotent) and set meta keys if absent
-    db.conn.executescript(SCHEMA_V1_SQL)
+    db.exec_script(SCHEMA_V1_SQL)
 
-    _set_meta_if_missing(db, "schema_version", "1")
-    _set_meta_if_missing(db, "schema_hash", schema_hash())
-    _set_meta_if_missing(db, "timezone", timezone)
-    _set_meta_if_missing(db, "workday_start", workday_start)
+    # meta.key is the primary key, so OR IGNORE keeps existing values.
+    db.exec_many(
+        "INSERT OR IGNORE INTO meta (key, value) VALUES (?, ?)",
+        [
+            ("schema_version", "1"),
+            ("schema_hash", schema_hash()),
+            ("timezone", timezone),
+            ("workday_start", workday_start),
+        ],
+    )
 
 
 def verify_schema_hash(db: Database) -> None:
@@ -113,9 +121,3 @@ def verify_schema_hash(db: Database) -> None:
             "This build expects a different frozen schema.\n"
             "Create a new DB or use a build matching this DB."
         )
-
-
-def _set_meta_if_missing(db: Database, key: str, value: str) -> None:
-    row = db.query_one("SELECT value FROM meta WHERE key=?", (key,))
-    if row is None:
-        db.exec("INSERT INTO meta (key, value) VALUES (?, ?)", (key, value))
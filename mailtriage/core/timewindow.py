@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from datetime import datetime, time, timedelta
 from zoneinfo import ZoneInfo
 
+_UTC = ZoneInfo("UTC")
+
 
 @dataclass(frozen=True)
 class Window:
@@ -14,13 +17,16 @@ class Window:
 
 def compute_windows(
     *,
-    timezone: str,
-    workday_start: str,  # HH:MM
+    timezone: str | ZoneInfo,
+    workday_start: str | tuple[int, int],  # HH:MM or pre-parsed (hh, mm)
     days: int | None,
     date: str | None,
 ) -> list[Window]:
-    tz = ZoneInfo(timezone)
-    hh, mm = _parse_hhmm(workday_start)
+    tz = timezone if isinstance(timezone, ZoneInfo) else ZoneInfo(timezone)
+    if isinstance(workday_start, tuple):
+        hh, mm = workday_start
+    else:
+        hh, mm = parse_hhmm(workday_start)
 
     now_local = datetime.now(tz)
 
@@ -54,17 +60,26 @@ def _window_for_day(d, tz: ZoneInfo, hh: int, mm: int) -> Window:
     start_local = datetime.combine(d, time(hh, mm), tzinfo=tz)
     end_local = start_local + timedelta(days=1)
 
-    start_utc = start_local.astimezone(ZoneInfo("UTC"))
-    end_utc = end_local.astimezone(ZoneInfo("UTC"))
+    start_utc = start_local.astimezone(_UTC)
+    end_utc = end_local.astimezone(_UTC)
 
     return Window(
         label_date=d.isoformat(),
-        start_utc=start_utc.strftime("%Y-%m-%dT%H:%M:%SZ"),
-        end_utc=end_utc.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        start_utc=iso_z(start_utc),
+        end_utc=iso_z(end_utc),
+    )
+
+
+def iso_z(dt: datetime) -> str:
+    # Same as dt.strftime("%Y-%m-%dT%H:%M:%SZ") without the libc strftime trip.
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z"
     )
 
 
-def _parse_hhmm(s: str) -> tuple[int, int]:
+@functools.lru_cache(maxsize=32)
+def parse_hhmm(s: str) -> tuple[int, int]:
     parts = s.split(":")
     if len(parts) != 2:
         raise ValueError("workday_start must be HH:MM")
@@ -4,6 +4,12 @@ import imaplib
 from dataclasses import dataclass
 from typing import Iterable
 
+# Only the headers triage reads; skips Received/DKIM/ARC chains on the wire.
+_HEADER_FIELDS_SPEC = (
+    "(BODY.PEEK[HEADER.FIELDS "
+    "(FROM TO CC SUBJECT DATE MESSAGE-ID IN-REPLY-TO REFERENCES)])"
+)
+
 
 @dataclass(frozen=True)
 class ImapAccount:
@@ -40,7 +46,7 @@ class ImapFetcher:
         if typ != "OK":
             raise RuntimeError(f"Cannot open folder read-only: {folder}")
 
-    def search_since(self, since_date: str) -> list[str]:
+    def search_since(self, since_date: str) -> list[bytes]:
         # since_date: e.g. "16-Dec-2025"
         assert self.conn
         typ, data = self.conn.search(None, "SINCE", since_date)
@@ -48,18 +54,18 @@ class ImapFetcher:
             raise RuntimeError("IMAP search failed")
         return data[0].split()
 
-    def fetch_headers(self, uids: Iterable[str]) -> dict[str, bytes]:
+    def fetch_headers(self, uids: Iterable[bytes]) -> dict[bytes, bytes]:
         assert self.conn
         if not uids:
             return {}
         seq = b",".join(uids)
-        typ, data = self.conn.fetch(seq, "(BODY.PEEK[HEADER])")
+        typ, data = self.conn.fetch(seq, _HEADER_FIELDS_SPEC)
         if typ != "OK":
             raise RuntimeError("IMAP header fetch failed")
-        out: dict[str, bytes] = {}
+        # Keys stay as the server's bytes; decode at the caller if needed.
+        out: dict[bytes, bytes] = {}
         for i in range(0, len(data), 2):
             if not data[i]:
                 continue
-            uid = data[i][0].split()[0].decode()
-            out[uid] = data[i][1]
+            out[data[i][0].split(None, 1)[0]] = data[i][1]
         return out
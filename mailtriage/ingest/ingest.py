@@ -1,31 +1,35 @@
 from __future__ import annotations
 
+import base64
 import hashlib
 import imaplib
 import json
+import multiprocessing
 import os
+import queue
 import re
-import signal
-import socket
 import subprocess
 import sys
+import threading
+import time
 import atexit
+import collections
+import functools
 import getpass
 import shutil
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from email import message_from_bytes
+from datetime import datetime, timedelta, timezone
 from email.header import decode_header, make_header
 from email.message import Message
+from email.parser import BytesHeaderParser, BytesParser
+from email.policy import compat32
 from email.utils import getaddresses, parsedate_to_datetime
-from typing import Iterable
+from typing import Callable, Iterable, Iterator
 
 from mailtriage.core.db import Database
-from mailtriage.core.extract import (
-    extract_attachment_names,
-    extract_new_text,
-    select_body,
-)
+from mailtriage.core.timewindow import iso_z
+from mailtriage.core.extract import extract_new_text, scan_message
 
 # ---------------------------------------------------------------------------
 # Secrets
@@ -42,12 +46,80 @@ class ResolvedSecrets:
     password: str
 
 
+def _secret_store_get(service: str, account: str) -> str | None:
+    # macOS Keychain
+    if sys.platform == "darwin" and shutil.which("security"):
+        try:
+            p = subprocess.run(
+                ["security", "find-generic-password", "-w", "-s", service, "-a", account],
+                check=True,
+                capture_output=True,
+                text=True,
+                timeout=5,
+            ).stdout.strip()
+            return p or None
+        except Exception:
+            return None
+
+    # Linux Secret Service
+    if sys.platform.startswith("linux") and shutil.which("secret-tool"):
+        try:
+            p = subprocess.run(
+                ["secret-tool", "lookup", "service", service, "user", account],
+                check=True,
+                capture_output=True,
+                text=True,
+                timeout=5,
+            ).stdout.strip()
+            return p or None
+        except Exception:
+            return None
+
+    return None
+
+
+def _secret_store_set(service: str, account: str, value: str) -> None:
+    # Best-effort; the value is passed on stdin, never in argv. Callers keep
+    # service/account/value free of quotes.
+    try:
+        if sys.platform == "darwin" and shutil.which("security"):
+            subprocess.run(
+                ["security", "-i"],
+                input=f'add-generic-password -U -s "{service}" -a "{account}" -w "{value}"\n',
+                check=False,
+                capture_output=True,
+                text=True,
+                timeout=5,
+            )
+        elif sys.platform.startswith("linux") and shutil.which("secret-tool"):
+            subprocess.run(
+                ["secret-tool", "store", "--label=MailTriage", "service", service, "user", account],
+                input=value,
+                check=False,
+                capture_output=True,
+                text=True,
+                timeout=5,
+            )
+    except Exception:
+        pass
+
+
 class SecretProvider:
     def resolve(self, reference: str) -> ResolvedSecrets:
         raise NotImplementedError
 
 
 class BitwardenSecretProvider(SecretProvider):
+    # Each `bw` call pays seconds of Node startup, and ingest resolves the same
+    # item once per window. Results are kept for the life of the process and,
+    # when MAILTRIAGE_BW_CACHE_TTL is set, in the OS secret store for that many
+    # seconds so back-to-back runs skip `bw` too. Never written to plain files.
+    _STORE_CACHE_SERVICE = "mailtriage/bitwarden-items"
+
+    _cache: dict[tuple[str, str], ResolvedSecrets] = {}
+    _cache_lock = threading.Lock()
+    _resolve_lock = threading.Lock()
+
     def __init__(self, bw_bin: str = "bw") -> None:
         self._bw_bin = bw_bin
 
@@ -56,6 +128,56 @@ class BitwardenSecretProvider(SecretProvider):
             sys.stderr.write(f"[mailtriage][bitwarden] {msg}\n")
 
     def resolve(self, reference: str) -> ResolvedSecrets:
+        key = (self._bw_bin, reference)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            self._debug(f"Using cached item {reference!r}")
+            return cached
+        # One miss at a time: `bw` unlock/get mutate os.environ["BW_SESSION"],
+        # and a second caller for the same item should reuse the first result.
+        with self._resolve_lock:
+            with self._cache_lock:
+                cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+            ttl = _bw_cache_ttl()
+            creds = self._load_stored(reference) if ttl else None
+            if creds is None:
+                creds = self._resolve_uncached(reference)
+                if ttl:
+                    self._store(reference, creds, ttl)
+            with self._cache_lock:
+                self._cache[key] = creds
+        return creds
+
+    def _store_account(self, reference: str) -> str:
+        # Hashed: item names may contain quotes and need not be visible in the store.
+        return hashlib.sha256(f"{self._bw_bin}\0{reference}".encode()).hexdigest()[:32]
+
+    def _load_stored(self, reference: str) -> ResolvedSecrets | None:
+        raw = _secret_store_get(self._STORE_CACHE_SERVICE, self._store_account(reference))
+        if not raw:
+            return None
+        try:
+            entry = json.loads(base64.b64decode(raw))
+            if float(entry["exp"]) <= time.time():
+                return None
+            creds = ResolvedSecrets(username=str(entry["u"]), password=str(entry["p"]))
+        except Exception:
+            return None
+        if not creds.username or not creds.password:
+            return None
+        self._debug(f"Using secret-store cached item {reference!r}")
+        return creds
+
+    def _store(self, reference: str, creds: ResolvedSecrets, ttl: int) -> None:
+        entry = {"u": creds.username, "p": creds.password, "exp": time.time() + ttl}
+        # base64 keeps the stored value quote- and newline-free.
+        value = base64.b64encode(json.dumps(entry).encode()).decode("ascii")
+        _secret_store_set(self._STORE_CACHE_SERVICE, self._store_account(reference), value)
+
+    def _resolve_uncached(self, reference: str) -> ResolvedSecrets:
         try:
             unlocked_here = False
             attempted_auto_unlock = False
@@ -96,36 +218,7 @@ class BitwardenSecretProvider(SecretProvider):
             def _secret_store_password() -> str | None:
                 svc = os.environ.get("MAILTRIAGE_BW_STORE_SERVICE") or "mailtriage/bitwarden"
                 user = os.environ.get("MAILTRIAGE_BW_STORE_USER") or getpass.getuser()
-
-                # macOS Keychain
-                if sys.platform == "darwin" and shutil.which("security"):
-                    try:
-                        p = subprocess.run(
-                            ["security", "find-generic-password", "-w", "-s", svc, "-a", user],
-                            check=True,
-                            capture_output=True,
-                            text=True,
-                            timeout=5,
-                        ).stdout.strip()
-                        return p or None
-                    except Exception:
-                        return None
-
-                # Linux Secret Service
-                if sys.platform.startswith("linux") and shutil.which("secret-tool"):
-                    try:
-                        p = subprocess.run(
-                            ["secret-tool", "lookup", "service", svc, "user", user],
-                            check=True,
-                            capture_output=True,
-                            text=True,
-                            timeout=5,
-                        ).stdout.strip()
-                        return p or None
-                    except Exception:
-                        return None
-
-                return None
+                return _secret_store_get(svc, user)
 
             def _auto_unlock_from_secret_store() -> bool:
                 nonlocal unlocked_here
@@ -172,9 +265,10 @@ class BitwardenSecretProvider(SecretProvider):
                 atexit.register(_lock_at_exit)
                 return True
 
-            # Avoid hanging on interactive prompts. If `BW_SESSION` is present,
-            # do NOT use `bw status` as a gate: some installations report
-            # "locked" even when a valid session token is set.
+            # No `bw status` gate: it costs a full `bw` startup, and some
+            # installations report "locked" even with a valid BW_SESSION. A
+            # locked/logged-out vault makes `bw get item` fail instead, and
+            # that error is classified below.
             has_session = bool(os.environ.get("BW_SESSION"))
             self._debug("BW_SESSION present: " + ("yes" if has_session else "no"))
 
@@ -183,20 +277,6 @@ class BitwardenSecretProvider(SecretProvider):
                 if _auto_unlock_from_secret_store():
                     has_session = True
 
-            if not has_session:
-                status = _run_bw("status", timeout=10)
-                try:
-                    st = json.loads(status.stdout)
-                    s = str(st.get("status", "")).lower()
-                    self._debug(f"bw status: {s!r}")
-                    if s in {"locked", "unauthenticated"}:
-                        raise SecretProviderError(
-                            f"Bitwarden status is '{s}'. Unlock/login Bitwarden before running."
-                        )
-                except json.JSONDecodeError:
-                    # Older bw versions may not return JSON; proceed and rely on timeout/error.
-                    pass
-
             self._debug(f"Fetching item {reference!r}")
             try:
                 proc = _run_bw("get", "item", reference, timeout=20)
@@ -236,6 +316,10 @@ class BitwardenSecretProvider(SecretProvider):
                     "Bitwarden vault is locked or session is missing/invalid. "
                     "Run `bw unlock --raw` and set BW_SESSION (or refresh the saved session file)."
                 ) from e
+            if "not logged in" in low or "unauthenticated" in low:
+                raise SecretProviderError(
+                    "Bitwarden CLI is not logged in. Run `bw login` before running."
+                ) from e
             raise SecretProviderError(err) from e
 
         item = json.loads(proc.stdout)
@@ -249,6 +333,14 @@ class BitwardenSecretProvider(SecretProvider):
         return ResolvedSecrets(username=username, password=password)
 
 
+def _bw_cache_ttl() -> int:
+    raw = (os.environ.get("MAILTRIAGE_BW_CACHE_TTL") or "").strip()
+    try:
+        return max(0, int(raw)) if raw else 0
+    except ValueError:
+        return 0
+
+
 class EnvSecretProvider(SecretProvider):
     def resolve(self, reference: str) -> ResolvedSecrets:
         key = reference.upper()
@@ -308,7 +400,20 @@ class FetchedMessage:
     internaldate_utc: datetime
 
 
-_INTERNALDATE_RE = re.compile(r'INTERNALDATE "([^"]+)"')
+# bytes pattern: FETCH metadata is matched without decoding it first
+_INTERNALDATE_RE = re.compile(rb'INTERNALDATE "([^"]+)"')
+# RFC 3501 date-time: fixed layout, so no need for the generic RFC 2822 parser.
+_INTERNALDATE_FIXED_RE = re.compile(
+    rb'INTERNALDATE "([ \d]?\d)-([A-Za-z]{3})-(\d{4}) (\d\d):(\d\d):(\d\d) ([+-])(\d\d)(\d\d)"'
+)
+_MONTHS = {
+    m: i
+    for i, m in enumerate(
+        (b"jan", b"feb", b"mar", b"apr", b"may", b"jun",
+         b"jul", b"aug", b"sep", b"oct", b"nov", b"dec"),
+        1,
+    )
+}
 
 
 def _debug(msg: str) -> None:
@@ -316,42 +421,82 @@ def _debug(msg: str) -> None:
         sys.stderr.write(f"[mailtriage] {msg}\n")
 
 
-def _call_with_alarm(seconds: int, fn, *args, **kwargs):
-    # Use a hard timeout so network/DNS/login issues don't hang forever.
-    if seconds <= 0:
-        return fn(*args, **kwargs)
-
-    def _handler(_signum, _frame):
-        raise TimeoutError(f"Timed out after {seconds}s")
-
-    old = signal.signal(signal.SIGALRM, _handler)
-    try:
-        signal.alarm(seconds)
-        return fn(*args, **kwargs)
-    finally:
-        signal.alarm(0)
-        signal.signal(signal.SIGALRM, old)
+_IMAP_TIMEOUT_S = 20
 
 
 def _connect_imap(acct: ImapAccount) -> imaplib.IMAP4_SSL:
     if not acct.ssl:
         raise RuntimeError("SSL required")
 
-    def _connect_and_login() -> imaplib.IMAP4_SSL:
-        # Best-effort socket timeout; the alarm above is the real safety net.
-        prev = socket.getdefaulttimeout()
-        socket.setdefaulttimeout(20)
+    # Per-socket timeout (connect and every read/write) so network/login
+    # issues don't hang forever; unlike SIGALRM or the process-wide socket
+    # default, it is safe from the ingest worker threads.
+    _debug(f"IMAP connect {acct.host}:{acct.port}")
+    conn = imaplib.IMAP4_SSL(acct.host, acct.port, timeout=_IMAP_TIMEOUT_S)
+    _debug("IMAP login")
+    conn.login(acct.username, acct.password)
+    _debug("IMAP login OK")
+    return conn
+
+
+# Authenticated connections kept for reuse across ingest_account calls (one per
+# window with `run --days N`). A connection is checked out while in use, so two
+# threads never share one.
+_IMAP_POOL: dict[tuple[str, int, str], list[imaplib.IMAP4_SSL]] = {}
+_IMAP_POOL_LOCK = threading.Lock()
+
+# Parallel IMAP connections per account (folders, or UID stripes of a single
+# large folder); also the idle connections kept per account. Well under the
+# usual per-user server limit (~10).
+_FOLDER_WORKERS = 4
+
+# Rows per executemany call when writing a folder's messages.
+_INSERT_BATCH_SIZE = 200
+
+
+def _pool_key(acct: ImapAccount) -> tuple[str, int, str]:
+    return (acct.host, acct.port, acct.username)
+
+
+def _logout_quietly(conn: imaplib.IMAP4_SSL) -> None:
+    try:
+        conn.logout()
+    except Exception:
+        pass
+
+
+def _acquire_imap(acct: ImapAccount) -> imaplib.IMAP4_SSL:
+    with _IMAP_POOL_LOCK:
+        idle = _IMAP_POOL.get(_pool_key(acct))
+        conn = idle.pop() if idle else None
+    if conn is not None:
         try:
-            _debug(f"IMAP connect {acct.host}:{acct.port}")
-            conn = imaplib.IMAP4_SSL(acct.host, acct.port)
-            _debug("IMAP login")
-            conn.login(acct.username, acct.password)
-            _debug("IMAP login OK")
-            return conn
-        finally:
-            socket.setdefaulttimeout(prev)
+            typ, _ = conn.noop()
+            if typ == "OK":
+                _debug(f"IMAP reuse {acct.host}:{acct.port}")
+                return conn
+        except Exception:
+            pass
+        _logout_quietly(conn)
+    return _connect_imap(acct)
+
+
+def _release_imap(acct: ImapAccount, conn: imaplib.IMAP4_SSL) -> None:
+    with _IMAP_POOL_LOCK:
+        idle = _IMAP_POOL.setdefault(_pool_key(acct), [])
+        if len(idle) < _FOLDER_WORKERS:
+            idle.append(conn)
+            return
+    _logout_quietly(conn)
 
-    return _call_with_alarm(45, _connect_and_login)
+
+@atexit.register
+def _drain_imap_pool() -> None:
+    with _IMAP_POOL_LOCK:
+        conns = [c for idle in _IMAP_POOL.values() for c in idle]
+        _IMAP_POOL.clear()
+    for conn in conns:
+        _logout_quietly(conn)
 
 
 def _select_readonly(conn: imaplib.IMAP4_SSL, folder: str) -> None:
@@ -360,52 +505,239 @@ def _select_readonly(conn: imaplib.IMAP4_SSL, folder: str) -> None:
         raise RuntimeError(f"Cannot open folder {folder}")
 
 
-def _search_since(conn: imaplib.IMAP4_SSL, since_date: str) -> list[str]:
+def _search_since(conn: imaplib.IMAP4_SSL, since_date: str) -> list[bytes]:
     typ, data = conn.search(None, "SINCE", since_date)
     if typ != "OK":
         return []
-    return data[0].decode().split()
+    # Stay in bytes: the ids only go back out in a FETCH set.
+    return data[0].split()
 
 
 def _parse_internaldate_to_utc(meta: bytes) -> datetime:
-    m = _INTERNALDATE_RE.search(meta.decode(errors="replace"))
+    m = _INTERNALDATE_FIXED_RE.search(meta)
+    if m:
+        day, mon, year, hh, mi, ss, sign, oh, om = m.groups()
+        month = _MONTHS.get(mon.lower())
+        if month:
+            try:
+                dt = datetime(int(year), month, int(day), int(hh), int(mi), int(ss), tzinfo=timezone.utc)
+            except ValueError:
+                pass
+            else:
+                offset = timedelta(hours=int(oh), minutes=int(om))
+                return dt + offset if sign == b"-" else dt - offset
+    m = _INTERNALDATE_RE.search(meta)
     if not m:
         return datetime.now(timezone.utc)
-    dt = parsedate_to_datetime(m.group(1))
+    dt = parsedate_to_datetime(m.group(1).decode(errors="replace"))
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
 
-def _fetch_rfc822_and_internaldate(
-    conn: imaplib.IMAP4_SSL, uids: Iterable[str]
-) -> dict[str, FetchedMessage]:
-    out: dict[str, FetchedMessage] = {}
-
-    uids = list(uids)
-    if not uids:
-        return out
-
-    for i in range(0, len(uids), 50):
-        chunk = uids[i : i + 50]
-        seq = ",".join(chunk).encode()
+_FETCH_PARTS = "(BODY.PEEK[] INTERNALDATE)"
+# Just enough to apply the window and already-stored checks before
+# downloading bodies.
+_DATE_PARTS = "(UID INTERNALDATE BODY.PEEK[HEADER.FIELDS (DATE MESSAGE-ID)])"
+_UID_RE = re.compile(rb"\bUID (\d+)")
+_FETCH_PIPELINE_DEPTH = 4
+# Body fetches aim for about this much literal data per FETCH command.
+_FETCH_TARGET_BYTES = 4 * 1024 * 1024
+_FETCH_MIN_BATCH = 10
 
-        typ, data = conn.fetch(seq, "(BODY.PEEK[] INTERNALDATE)")
-        if typ != "OK":
-            raise RuntimeError("IMAP fetch failed")
 
-        for item in data:
+def _fetch_pipelined(
+    conn: imaplib.IMAP4_SSL,
+    uids: Iterable[bytes],
+    parts: str,
+    *,
+    batch_size: int,
+    target_bytes: int = 0,
+    by_uid: bool = False,
+) -> Iterator[tuple[bytes, bytes]]:
+    """
+    FETCH `parts` for uids (sequence numbers, or UIDs with by_uid) in bounded
+    batches; yields (metadata, literal) per message. Metadata also includes
+    any data the server sent after the literal. With target_bytes, later
+    batches are resized from the mean literal size seen so far (never above
+    batch_size).
+    """
+    cmd = ("UID", "FETCH") if by_uid else ("FETCH",)
+    # Bounded FETCH commands: servers reject oversized requests, and
+    # moderate batches beat one giant command end-to-end.
+    uids = list(uids)
+    size = batch_size
+    seen_bytes = seen_msgs = 0
+    pos = 0
+    while pos < len(uids):
+        window = []
+        for _ in range(_FETCH_PIPELINE_DEPTH):
+            if pos >= len(uids):
+                break
+            window.append(uids[pos : pos + size])
+            pos += size
+
+        # Pipeline: send the window's FETCHes back-to-back, then read the
+        # tagged completions in order, so each batch doesn't wait a full RTT.
+        # imaplib has no public API for this; _command/_command_complete are
+        # what IMAP4.fetch itself is built on.
+        tags = [conn._command(*cmd, b",".join(chunk), parts) for chunk in window]
+        for tag in tags:
+            typ, _ = conn._command_complete(cmd[0], tag)
+            if typ != "OK":
+                raise RuntimeError("IMAP fetch failed")
+        _, data = conn._untagged_response("OK", [None], "FETCH")
+
+        for i, item in enumerate(data):
             if not isinstance(item, tuple):
                 continue
-            meta, raw = item
-            uid = meta.decode(errors="replace").split()[0]
-            out[uid] = FetchedMessage(
-                uid=uid,
-                raw_rfc822=raw,
-                internaldate_utc=_parse_internaldate_to_utc(meta),
-            )
+            meta, literal = item
+            tail = data[i + 1] if i + 1 < len(data) else None
+            if isinstance(tail, bytes):
+                meta += b" " + tail
+            seen_bytes += len(literal)
+            seen_msgs += 1
+            yield meta, literal
+
+        if target_bytes and seen_bytes:
+            # Few large messages per command, many small ones.
+            fit = target_bytes * seen_msgs // seen_bytes
+            size = max(min(_FETCH_MIN_BATCH, batch_size), min(fit, batch_size))
+
+
+def _filter_in_window(
+    conn: imaplib.IMAP4_SSL,
+    uids: Iterable[bytes],
+    window_start_utc: datetime,
+    window_end_utc: datetime,
+    *,
+    known_ids: frozenset[str] = frozenset(),
+    batch_size: int = 100,
+) -> list[tuple[bytes, bytes | None]]:
+    # SINCE is day-granular: drop out-of-window messages using only their
+    # Date header + INTERNALDATE (the same rule as resolve_timestamp_utc),
+    # so their bodies are never downloaded. Messages whose Message-ID is
+    # already stored are dropped too; INSERT OR IGNORE would skip them.
+    # Returns (sequence number, UID) pairs; UID is None if the server omitted it.
+    keep: list[tuple[bytes, bytes | None]] = []
+    for meta, hdr in _fetch_pipelined(conn, uids, _DATE_PARTS, batch_size=batch_size):
+        headers = _HEADER_PARSER.parsebytes(hdr)
+        ts = resolve_timestamp_utc(headers, _parse_internaldate_to_utc(meta))
+        if not (window_start_utc <= ts < window_end_utc):
+            continue
+        if known_ids and _message_id_header(headers) in known_ids:
+            continue
+        m = _UID_RE.search(meta)
+        keep.append((meta.split(None, 1)[0], m.group(1) if m else None))
+    return keep
+
+
+def _iter_rfc822_and_internaldate(
+    conn: imaplib.IMAP4_SSL,
+    uids: Iterable[bytes],
+    *,
+    batch_size: int = 100,
+    by_uid: bool = False,
+) -> Iterator[FetchedMessage]:
+    # FetchedMessage.uid is the sequence number from the response either way.
+    for meta, raw in _fetch_pipelined(
+        conn,
+        uids,
+        _FETCH_PARTS,
+        batch_size=batch_size,
+        target_bytes=_FETCH_TARGET_BYTES,
+        by_uid=by_uid,
+    ):
+        yield FetchedMessage(
+            uid=meta.split(None, 1)[0].decode(errors="replace"),
+            raw_rfc822=raw,
+            internaldate_utc=_parse_internaldate_to_utc(meta),
+        )
+
+
+# Ends a per-folder or per-stripe queue of results.
+_STREAM_DONE = object()
+
+
+def _fetch_stripe(
+    acct: ImapAccount,
+    folder: str,
+    uids: list[bytes],
+    out: queue.Queue,
+    stop: threading.Event,
+    *,
+    batch_size: int,
+) -> None:
+    # One stripe of a folder's bodies on its own connection (UID FETCH).
+    try:
+        conn = _acquire_imap(acct)
+        ok = False
+        try:
+            _select_readonly(conn, folder)
+            for fm in _iter_rfc822_and_internaldate(
+                conn, uids, batch_size=batch_size, by_uid=True
+            ):
+                if stop.is_set():
+                    break
+                out.put(fm)
+            else:
+                ok = True
+        finally:
+            if ok:
+                _release_imap(acct, conn)
+            else:
+                _logout_quietly(conn)
+    except BaseException as e:
+        out.put(e)
+    else:
+        out.put(_STREAM_DONE)
 
-    return out
+
+def _iter_bodies(
+    acct: ImapAccount,
+    conn: imaplib.IMAP4_SSL,
+    folder: str,
+    kept: list[tuple[bytes, bytes | None]],
+    *,
+    batch_size: int,
+    stripes: int,
+) -> Iterator[FetchedMessage]:
+    """
+    Bodies for `kept` in order. Large folders are split into contiguous UID
+    stripes fetched in parallel: the first on `conn` (already selected),
+    the rest on extra pooled connections.
+    """
+    uids = [u for _, u in kept]
+    stripes = min(stripes, len(kept) // batch_size)
+    if stripes <= 1 or None in uids:
+        yield from _iter_rfc822_and_internaldate(
+            conn, [seq for seq, _ in kept], batch_size=batch_size
+        )
+        return
+
+    # Each connection reads its own socket in parallel; the ranges are
+    # independent because they are addressed by UID, not sequence number.
+    step = -(-len(uids) // stripes)
+    first, *rest = [uids[i : i + step] for i in range(0, len(uids), step)]
+    outs: list[queue.Queue] = [queue.Queue() for _ in rest]
+    stop = threading.Event()
+    ex = ThreadPoolExecutor(max_workers=len(rest))
+    try:
+        for part, out in zip(rest, outs):
+            ex.submit(
+                _fetch_stripe, acct, folder, part, out, stop, batch_size=batch_size
+            )
+        yield from _iter_rfc822_and_internaldate(
+            conn, first, batch_size=batch_size, by_uid=True
+        )
+        for out in outs:
+            while (item := out.get()) is not _STREAM_DONE:
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+    finally:
+        stop.set()
+        ex.shutdown(wait=True)
 
 
 # ---------------------------------------------------------------------------
@@ -419,67 +751,148 @@ _MSGID_RE = re.compile(r"<[^>]+>")
 def decode_mime_header(value: str | None) -> str:
     if not value:
         return ""
+    # compat32 hands back a Header object (unhashable) for raw 8-bit headers.
+    if isinstance(value, str):
+        return _decode_mime_header_cached(value)
+    return _decode_mime_header(value)
+
+
+def _decode_mime_header(value) -> str:
     try:
         return str(make_header(decode_header(value)))
     except Exception:
         return value
 
 
+# List mail and auto-responders repeat the same encoded subjects/senders.
+_decode_mime_header_cached = functools.lru_cache(maxsize=4096)(_decode_mime_header)
+
+
+_PARSER = BytesParser(policy=compat32)
+_HEADER_PARSER = BytesHeaderParser(policy=compat32)
+
+
+def _header_block(raw: bytes) -> bytes:
+    # Bytes up to (not including) the first empty line.
+    ends = [i for i in (raw.find(b"\n\n"), raw.find(b"\n\r\n")) if i != -1]
+    return raw[: min(ends) + 1] if ends else raw
+
+
 def resolve_timestamp_utc(msg: Message, fallback: datetime) -> datetime:
     hdr = msg.get("Date")
-    if hdr:
+    if hdr and isinstance(hdr, str):
+        dt = _parse_date_header_utc(hdr)
+        if dt is not None:
+            return dt
+    elif hdr:
         try:
-            dt = parsedate_to_datetime(hdr)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.astimezone(timezone.utc)
+            return _to_utc(parsedate_to_datetime(hdr))
         except Exception:
             pass
     return fallback
 
 
-def compute_message_id(msg: Message, account_id: str, folder: str, uid: str) -> str:
+def _to_utc(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+# The Date header is checked in the prefilter and again before the full
+# parse, and bulk imports repeat values; parse each distinct one once.
+@functools.lru_cache(maxsize=4096)
+def _parse_date_header_utc(hdr: str) -> datetime | None:
+    try:
+        return _to_utc(parsedate_to_datetime(hdr))
+    except Exception:
+        return None
+
+
+def _message_id_header(msg: Message) -> str | None:
     mid = (msg.get("Message-ID") or "").strip()
     if mid and _MSGID_RE.fullmatch(mid):
         return mid
-    return f"synthetic:{account_id}:{folder}:{uid}"
+    return None
+
 
+def compute_message_id(msg: Message, account_id: str, folder: str, uid: str) -> str:
+    return _message_id_header(msg) or f"synthetic:{account_id}:{folder}:{uid}"
 
-_SUBJ_PREFIX_RE = re.compile(r"^\s*(re|fw|fwd)\s*:\s*", re.I)
+
+# Any run of leading Re:/Fw:/Fwd: prefixes, stripped in a single sub.
+_SUBJ_PREFIX_RE = re.compile(r"^(?:\s*(?:re|fw|fwd)\s*:\s*)+", re.I)
 
 
 def _normalize_subject(s: str) -> str:
-    while True:
-        ns = _SUBJ_PREFIX_RE.sub("", s)
-        if ns == s:
-            break
-        s = ns
-    return re.sub(r"\s+", " ", s).strip().lower()
+    s = _SUBJ_PREFIX_RE.sub("", s, count=1)
+    # split()/join collapses and trims whitespace exactly like \s+ -> " " + strip()
+    return " ".join(s.split()).lower()
 
 
-def compute_thread_id(msg: Message) -> str:
+def compute_thread_id(msg: Message, *, subject: str | None = None) -> str:
+    # subject: the already-decoded Subject, if the caller has it.
     refs = msg.get("References") or ""
     m = _MSGID_RE.search(refs)
     if m:
         basis = f"ref:{m.group(0)}"
     else:
-        subj = _normalize_subject(decode_mime_header(msg.get("Subject")))
-        basis = f"subj:{subj}"
+        if subject is None:
+            subject = decode_mime_header(msg.get("Subject"))
+        basis = f"subj:{_normalize_subject(subject)}"
+    return _thread_digest(basis)
+
+
+# Messages of one thread share a basis; hash each distinct one once.
+@functools.lru_cache(maxsize=4096)
+def _thread_digest(basis: str) -> str:
     return hashlib.sha256(basis.encode()).hexdigest()
 
 
 def extract_sender(msg: Message) -> tuple[str, str | None]:
-    addrs = getaddresses([msg.get("From", "")])
+    value = msg.get("From")
+    addrs = getaddresses([value]) if value else None
     if not addrs:
         return "", None
     name, email = addrs[0]
     return email.lower().strip(), name.strip() or None
 
 
+def _header_addrs(msg: Message, name: str) -> list[str]:
+    # Lowercased addresses from an address-list header; [] when absent.
+    value = msg.get(name)
+    if not value:
+        return []
+    if isinstance(value, str):
+        return list(_parse_addrs_cached(value))
+    return _parse_addrs(value)
+
+
+def _parse_addrs(value) -> list[str]:
+    return [addr.lower() for _, addr in getaddresses([value]) if addr]
+
+
+# To/Cc values repeat across a mailbox (the user's own address, lists).
+@functools.lru_cache(maxsize=4096)
+def _parse_addrs_cached(value: str) -> tuple[str, ...]:
+    return tuple(_parse_addrs(value))
+
+
 # ---------------------------------------------------------------------------
 # DB writes
 # ---------------------------------------------------------------------------
 
+
+def known_message_ids(
+    db: Database, window_start_utc: datetime, window_end_utc: datetime
+) -> frozenset[str]:
+    # Message-IDs already stored for the window; ingest skips their bodies.
+    rows = db.conn.execute(
+        "SELECT message_id FROM messages WHERE date_utc >= ? AND date_utc < ?",
+        (iso_z(window_start_utc), iso_z(window_end_utc)),
+    ).fetchall()
+    return frozenset(r[0] for r in rows)
+
+
 def ensure_account(
     db: Database,
     *,
@@ -498,6 +911,63 @@ def ensure_account(
     )
 
 
+_INSERT_MESSAGE_SQL = """
+INSERT OR IGNORE INTO messages (
+    message_id, account_id, folder, date_utc,
+    sender,
+    recipients_to, recipients_cc,
+    subject, inbound, outbound,
+    extracted_new_text,
+    has_attachments, attachment_names,
+    thread_id, created_at_utc
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+# Compact, UTF-8-preserving JSON for the list columns. A prebuilt encoder:
+# json.dumps with non-default options constructs a new one on every call.
+_encode_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+def _message_row(
+    *,
+    message_id: str,
+    account_id: str,
+    folder: str,
+    date_utc: datetime,
+    sender: str,
+    to_addrs: list[str],
+    cc_addrs: list[str],
+    subject: str,
+    inbound: bool,
+    outbound: bool,
+    extracted_text: str,
+    has_attachments: bool,
+    attachment_names: list[str],
+    thread_id: str,
+    created_at_utc: str,
+) -> tuple[object, ...]:
+    # Bound parameters for _INSERT_MESSAGE_SQL, already stringified.
+    # date_utc is UTC (resolve_timestamp_utc).
+    return (
+        message_id,
+        account_id,
+        folder,
+        iso_z(date_utc),
+        sender,
+        _encode_json(to_addrs) if to_addrs else "[]",
+        _encode_json(cc_addrs) if cc_addrs else "[]",
+        subject,
+        1 if inbound else 0,
+        1 if outbound else 0,
+        extracted_text,
+        1 if has_attachments else 0,
+        _encode_json(attachment_names) if attachment_names else None,
+        thread_id,
+        created_at_utc,
+    )
+
+
 def insert_message(
     db: Database,
     *,
@@ -515,119 +985,280 @@ def insert_message(
     has_attachments: bool,
     attachment_names: list[str],
     thread_id: str,
+    created_at_utc: str | None = None,
 ) -> None:
     db.exec(
-        """
-        INSERT OR IGNORE INTO messages (
-            message_id, account_id, folder, date_utc,
-            sender,
-            recipients_to, recipients_cc,
-            subject, inbound, outbound,
-            extracted_new_text,
-            has_attachments, attachment_names,
-            thread_id, created_at_utc
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%SZ','now'))
-        """,
-        (
-            message_id,
-            account_id,
-            folder,
-            date_utc.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            sender,
-            json.dumps(to_addrs),
-            json.dumps(cc_addrs),
-            subject,
-            1 if inbound else 0,
-            1 if outbound else 0,
-            extracted_text,
-            1 if has_attachments else 0,
-            json.dumps(attachment_names) if attachment_names else None,
-            thread_id,
+        _INSERT_MESSAGE_SQL,
+        _message_row(
+            message_id=message_id,
+            account_id=account_id,
+            folder=folder,
+            date_utc=date_utc,
+            sender=sender,
+            to_addrs=to_addrs,
+            cc_addrs=cc_addrs,
+            subject=subject,
+            inbound=inbound,
+            outbound=outbound,
+            extracted_text=extracted_text,
+            has_attachments=has_attachments,
+            attachment_names=attachment_names,
+            thread_id=thread_id,
+            created_at_utc=created_at_utc or iso_z(datetime.now(timezone.utc)),
         ),
     )
 
 
+def insert_messages_bulk(db: Database, rows: Iterable[tuple[object, ...]]) -> None:
+    # rows are _message_row() tuples; one prepared statement for the batch.
+    db.exec_many(_INSERT_MESSAGE_SQL, rows)
+
+
 # ---------------------------------------------------------------------------
 # Main ingestion
 # ---------------------------------------------------------------------------
 
 
+@dataclass(frozen=True)
+class _ParseContext:
+    # Everything _parse_fetched needs besides the messages; picklable so it
+    # can go to the parse pool.
+    account_id: str
+    folder: str
+    identity_addrs: frozenset[str]
+    window_start_utc: datetime
+    window_end_utc: datetime
+    created_at_utc: str
+
+
+def _parse_fetched(
+    ctx: _ParseContext, fetched: list[FetchedMessage]
+) -> list[tuple[object, ...]]:
+    rows: list[tuple[object, ...]] = []
+    for fm in fetched:
+        # Re-check against the message's own header block (cheap) before the
+        # full MIME parse; the server's HEADER.FIELDS view can differ on
+        # malformed headers.
+        raw = fm.raw_rfc822
+        ts = resolve_timestamp_utc(
+            _HEADER_PARSER.parsebytes(_header_block(raw)), fm.internaldate_utc
+        )
+        if not (ctx.window_start_utc <= ts < ctx.window_end_utc):
+            continue
+
+        msg = _PARSER.parsebytes(raw)
+
+        sender, _sender_display = extract_sender(msg)
+        subject = decode_mime_header(msg.get("Subject"))
+
+        to_addrs = _header_addrs(msg, "To")
+        cc_addrs = _header_addrs(msg, "Cc")
+
+        outbound = sender in ctx.identity_addrs
+        inbound = not outbound
+
+        message_id = compute_message_id(msg, ctx.account_id, ctx.folder, fm.uid)
+        thread_id = compute_thread_id(msg, subject=subject)
+
+        body, _, attachment_names = scan_message(msg)
+        extracted = extract_new_text(subject=subject, body=body)
+
+        rows.append(
+            _message_row(
+                message_id=message_id,
+                account_id=ctx.account_id,
+                folder=ctx.folder,
+                date_utc=ts,
+                sender=sender,
+                to_addrs=to_addrs,
+                cc_addrs=cc_addrs,
+                subject=subject,
+                inbound=inbound,
+                outbound=outbound,
+                extracted_text=extracted.text,
+                has_attachments=bool(attachment_names),
+                attachment_names=attachment_names,
+                thread_id=thread_id,
+                created_at_utc=ctx.created_at_utc,
+            )
+        )
+    return rows
+
+
+# MIME parsing + extraction is CPU-bound and holds the GIL, so large folders
+# parse in worker processes while this thread keeps fetching. Below
+# _PARSE_POOL_MIN messages, process startup costs more than it saves.
+_PARSE_POOL_MIN = 500
+_PARSE_CHUNK = 50
+_PARSE_POOL: ProcessPoolExecutor | None = None
+_PARSE_POOL_LOCK = threading.Lock()
+
+
+def _parse_pool() -> ProcessPoolExecutor | None:
+    global _PARSE_POOL
+    workers = min(os.cpu_count() or 1, 8)
+    if workers < 2:
+        return None
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None:
+            # spawn, not fork: the IMAP worker threads are already running.
+            _PARSE_POOL = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            atexit.register(_PARSE_POOL.shutdown, cancel_futures=True)
+        return _PARSE_POOL
+
+
+def _collect_folder(
+    acct: ImapAccount,
+    account_cfg,
+    identity_addrs: frozenset[str],
+    folder: str,
+    emit: Callable[[list[tuple[object, ...]]], None],
+    *,
+    window_start_utc: datetime,
+    window_end_utc: datetime,
+    fetch_batch_size: int,
+    known_ids: frozenset[str],
+    stripes: int = 1,
+) -> None:
+    """
+    Fetch and parse one folder on its own connection(s), passing _message_row
+    tuples to emit() in UID order, in chunks of up to _INSERT_BATCH_SIZE.
+    Messages are parsed as their FETCH batches arrive. No database access, so
+    it can run on any thread.
+    """
+    ctx = _ParseContext(
+        account_id=account_cfg.id,
+        folder=folder,
+        identity_addrs=identity_addrs,
+        window_start_utc=window_start_utc,
+        window_end_utc=window_end_utc,
+        # One timestamp per folder pass rather than a per-row SQL strftime('now').
+        created_at_utc=iso_z(datetime.now(timezone.utc)),
+    )
+    rows: list[tuple[object, ...]] = []
+    # Parsed (list) or in-flight (Future) chunks, in UID order.
+    parsed: collections.deque[list[tuple[object, ...]] | Future] = collections.deque()
+
+    def _flush(*, wait_all: bool) -> None:
+        nonlocal rows
+        while parsed:
+            head = parsed[0]
+            if isinstance(head, Future) and not (wait_all or head.done()):
+                return
+            parsed.popleft()
+            rows += head.result() if isinstance(head, Future) else head
+            if len(rows) >= _INSERT_BATCH_SIZE:
+                emit(rows)
+                rows = []
+
+    conn = _acquire_imap(acct)
+    ok = False
+
+    try:
+        _select_readonly(conn, folder)
+        uids = _search_since(conn, window_start_utc.strftime("%d-%b-%Y"))
+        kept = _filter_in_window(
+            conn,
+            uids,
+            window_start_utc,
+            window_end_utc,
+            known_ids=known_ids,
+            batch_size=fetch_batch_size,
+        )
+        pool = _parse_pool() if len(kept) >= _PARSE_POOL_MIN else None
+
+        chunk: list[FetchedMessage] = []
+        for fm in _iter_bodies(
+            acct, conn, folder, kept, batch_size=fetch_batch_size, stripes=stripes
+        ):
+            chunk.append(fm)
+            if len(chunk) < _PARSE_CHUNK:
+                continue
+            if pool is not None:
+                parsed.append(pool.submit(_parse_fetched, ctx, chunk))
+            else:
+                parsed.append(_parse_fetched(ctx, chunk))
+            chunk = []
+            _flush(wait_all=False)
+        if chunk:
+            parsed.append(_parse_fetched(ctx, chunk))
+        ok = True
+    finally:
+        # Healthy connections go back to the pool; anything that failed
+        # mid-command is dropped.
+        if ok:
+            _release_imap(acct, conn)
+        else:
+            _logout_quietly(conn)
+
+    _flush(wait_all=True)
+    if rows:
+        emit(rows)
+
+
 def ingest_account(
     *,
     db: Database,
     account_cfg,
     window_start_utc: datetime,
     window_end_utc: datetime,
+    fetch_batch_size: int = 100,
+    known_ids: frozenset[str] = frozenset(),
+    imap_account: ImapAccount | None = None,
 ) -> None:
+    # imap_account: credentials already resolved by the caller. Secret
+    # providers are not thread-safe (bw shares BW_SESSION via os.environ),
+    # so callers running accounts concurrently resolve them up front.
+    primary_address = account_cfg.identity.primary_address.lower()
+    aliases = [a.lower() for a in account_cfg.identity.aliases]
     ensure_account(
         db,
         account_id=account_cfg.id,
-        primary_address=account_cfg.identity.primary_address.lower(),
-        aliases=[a.lower() for a in account_cfg.identity.aliases],
+        primary_address=primary_address,
+        aliases=aliases,
+    )
+    # Lowercased once per account; every message's sender is checked against it.
+    identity_addrs = frozenset([primary_address, *aliases])
+
+    acct = imap_account or build_imap_account(account_cfg=account_cfg)
+    collect = functools.partial(
+        _collect_folder,
+        acct,
+        account_cfg,
+        identity_addrs,
+        window_start_utc=window_start_utc,
+        window_end_utc=window_end_utc,
+        fetch_batch_size=fetch_batch_size,
+        known_ids=known_ids,
+        # Share the per-account connection budget: few folders -> more
+        # connections per folder.
+        stripes=max(1, _FOLDER_WORKERS // max(1, len(acct.folders))),
     )
 
-    acct = build_imap_account(account_cfg=account_cfg)
-    conn: imaplib.IMAP4_SSL | None = None
-
+    def _produce(folder: str, q: queue.Queue) -> None:
+        try:
+            collect(folder, q.put)
+        except BaseException as e:
+            q.put(e)
+        else:
+            q.put(_STREAM_DONE)
+
+    # Fetch + parse run on worker threads (folders in parallel, on separate
+    # connections); row chunks are written here as they arrive, so inserts
+    # overlap with network and parsing. Writes stay on this thread, in folder
+    # order, so db never crosses threads. Rows already received from a folder
+    # that later fails are kept.
+    streams: list[queue.Queue] = [queue.Queue() for _ in acct.folders]
+    ex = ThreadPoolExecutor(max_workers=min(len(acct.folders), _FOLDER_WORKERS) or 1)
     try:
-        conn = _connect_imap(acct)
-        since_str = window_start_utc.strftime("%d-%b-%Y")
-
-        for folder in acct.folders:
-            _select_readonly(conn, folder)
-            uids = _search_since(conn, since_str)
-            fetched = _fetch_rfc822_and_internaldate(conn, uids)
-
-            for uid, fm in fetched.items():
-                msg = message_from_bytes(fm.raw_rfc822)
-
-                ts = resolve_timestamp_utc(msg, fm.internaldate_utc)
-                if not (window_start_utc <= ts < window_end_utc):
-                    continue
-
-                sender, _sender_display = extract_sender(msg)
-                subject = decode_mime_header(msg.get("Subject"))
-
-                to_addrs = [
-                    a[1].lower() for a in getaddresses([msg.get("To", "")]) if a[1]
-                ]
-                cc_addrs = [
-                    a[1].lower() for a in getaddresses([msg.get("Cc", "")]) if a[1]
-                ]
-
-                outbound = sender in {
-                    account_cfg.identity.primary_address.lower(),
-                    *(a.lower() for a in account_cfg.identity.aliases),
-                }
-                inbound = not outbound
-
-                message_id = compute_message_id(msg, account_cfg.id, folder, uid)
-                thread_id = compute_thread_id(msg)
-
-                body, _ = select_body(msg)
-                extracted = extract_new_text(subject=subject, body=body)
-
-                insert_message(
-                    db,
-                    message_id=message_id,
-                    account_id=account_cfg.id,
-                    folder=folder,
-                    date_utc=ts,
-                    sender=sender,
-                    to_addrs=to_addrs,
-                    cc_addrs=cc_addrs,
-                    subject=subject,
-                    inbound=inbound,
-                    outbound=outbound,
-                    extracted_text=extracted.text,
-                    has_attachments=bool(extract_attachment_names(msg)),
-                    attachment_names=extract_attachment_names(msg),
-                    thread_id=thread_id,
-                )
-
+        for folder, q in zip(acct.folders, streams):
+            ex.submit(_produce, folder, q)
+        for q in streams:
+            while (item := q.get()) is not _STREAM_DONE:
+                if isinstance(item, BaseException):
+                    raise item
+                insert_messages_bulk(db, item)
     finally:
-        if conn:
-            try:
-                conn.logout()
-            except Exception:
-                pass
+        ex.shutdown(cancel_futures=True)
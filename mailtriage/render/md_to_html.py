@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import html
+import string
 from pathlib import Path
 
 
@@ -73,48 +74,54 @@ def markdown_to_html_body(markdown_text: str) -> str:
     return "\n".join(out)
 
 
-def render_report_html(*, title: str, body_html: str) -> str:
-    return f"""<!doctype html>
+# Static report shell, built once at import; only title/body vary per window.
+_REPORT_HTML = string.Template(
+    """<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1" />
-  <title>{html.escape(title)}</title>
+  <title>$title</title>
   <style>
-    :root {{
+    :root {
       --bg: #ffffff;
       --text: #0f172a;
       --muted: rgba(15, 23, 42, 0.70);
       --border: rgba(15, 23, 42, 0.14);
       --accent: #1d4ed8;
-    }}
-    * {{ box-sizing: border-box; }}
-    body {{
+    }
+    * { box-sizing: border-box; }
+    body {
       margin: 0;
       background: var(--bg);
       color: var(--text);
       font: 15px/1.55 ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial;
       padding: 20px 18px 44px;
-    }}
-    .doc {{ max-width: 980px; margin: 0 auto; }}
-    h1 {{ font-size: 22px; margin: 0 0 10px; letter-spacing: 0.2px; }}
-    h2 {{ font-size: 16px; margin: 18px 0 10px; }}
-    h3 {{ font-size: 14px; margin: 14px 0 8px; color: var(--accent); }}
-    p {{ margin: 8px 0; }}
-    ul {{ margin: 8px 0 8px 20px; padding: 0; }}
-    li {{ margin: 6px 0; }}
-    hr {{ border: 0; border-top: 1px solid var(--border); margin: 16px 0; }}
-    .sp {{ height: 6px; }}
-    em {{ color: var(--muted); }}
+    }
+    .doc { max-width: 980px; margin: 0 auto; }
+    h1 { font-size: 22px; margin: 0 0 10px; letter-spacing: 0.2px; }
+    h2 { font-size: 16px; margin: 18px 0 10px; }
+    h3 { font-size: 14px; margin: 14px 0 8px; color: var(--accent); }
+    p { margin: 8px 0; }
+    ul { margin: 8px 0 8px 20px; padding: 0; }
+    li { margin: 6px 0; }
+    hr { border: 0; border-top: 1px solid var(--border); margin: 16px 0; }
+    .sp { height: 6px; }
+    em { color: var(--muted); }
   </style>
 </head>
 <body>
   <div class="doc">
-    {body_html}
+    $body_html
   </div>
 </body>
 </html>
 """
+)
+
+
+def render_report_html(*, title: str, body_html: str) -> str:
+    return _REPORT_HTML.substitute(title=html.escape(title), body_html=body_html)
 
 
 def write_report_html(md_path: Path, html_path: Path) -> None:
@@ -152,7 +152,8 @@ def normalize_excerpt(text: str) -> str:
             break
         if ln.startswith(">"):
             break
-        if ln.lower().startswith("on ") and "wrote:" in ln.lower():
+        # cheap prefix test first; lowercase the whole line only on a hit
+        if ln[:3].lower() == "on " and "wrote:" in ln.lower():
             break
         lines.append(ln)
         if len(lines) == 3:
@@ -201,9 +202,9 @@ def render_window(
     window_end_utc: datetime,
     rootdir: Path,
     rules,
-    timezone: str,
+    timezone: str | ZoneInfo,
 ) -> None:
-    tz = ZoneInfo(timezone)
+    tz = timezone if isinstance(timezone, ZoneInfo) else ZoneInfo(timezone)
 
     # ------------------------------------------------------------
     # Load messages strictly within window
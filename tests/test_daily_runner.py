@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from mailtriage.automation.daily_runner import _parse_manual_dates
+
+
+def _write(tmp_path, text: str):
+    p = tmp_path / "holidays.txt"
+    p.write_text(text, encoding="utf-8")
+    return p
+
+
+def test_manual_dates_skip_comments_and_blank_lines(tmp_path):
+    p = _write(tmp_path, "# holidays\n\n2025-12-25\n  2026-01-01  \r\n")
+    assert _parse_manual_dates(p) == {date(2025, 12, 25), date(2026, 1, 1)}
+
+
+def test_manual_dates_reject_inline_comment(tmp_path):
+    p = _write(tmp_path, "2025-12-24\n2025-12-25 # xmas\n")
+    with pytest.raises(ValueError, match=r"holidays\.txt:2: .*2025-12-25 # xmas"):
+        _parse_manual_dates(p)
+
+
+def test_manual_dates_reject_unpadded_date(tmp_path):
+    p = _write(tmp_path, "2025-1-5\n")
+    with pytest.raises(ValueError, match=r"holidays\.txt:1: .*2025-1-5"):
+        _parse_manual_dates(p)
+
+
+def test_manual_dates_reject_impossible_date(tmp_path):
+    p = _write(tmp_path, "2025-02-30\n")
+    with pytest.raises(ValueError, match=r"holidays\.txt"):
+        _parse_manual_dates(p)